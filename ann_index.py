@@ -0,0 +1,327 @@
+"""
+Approximate nearest neighbour search over dense case embeddings.
+
+TF-IDF document vectors from a LegalCaseIndex are reduced to 128-256
+dimensional float32 embeddings with TruncatedSVD (LSA) or a sparse random
+projection. The embeddings are stored in a memory-mapped array, grouped by
+an inverted-file (IVF) partitioning computed with a small pure-NumPy
+spherical k-means, so a query only scores the vectors in the few partitions
+closest to it. ``n_probe`` trades recall for latency.
+
+Documents added to the case index afterwards are projected with the fitted
+reducer and assigned to their nearest partition, and removed documents are
+masked, so only a refit of the case index (e.g. compaction) needs a rebuild.
+"""
+
+import copy
+import os
+import threading
+import time
+
+import numpy as np
+from sklearn.decomposition import TruncatedSVD
+from sklearn.random_projection import SparseRandomProjection
+
+from search_index import INDEX_PATH, top_k_indices
+
+# Default on-disk location for the memory-mapped embeddings
+EMBEDDINGS_PATH = os.path.join(os.path.dirname(INDEX_PATH), "case_embeddings.npy")
+
+# Rows scored at a time when assigning vectors to partitions
+ASSIGN_CHUNK_SIZE = 65536
+
+# Upper bound on the number of vectors used to train the partition centroids
+KMEANS_SAMPLE_SIZE = 100000
+
+
+def _normalize_rows(matrix):
+    """L2-normalize the rows of a dense matrix in float32."""
+    matrix = np.asarray(matrix, dtype=np.float32)
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return matrix / norms
+
+
+def _assign(vectors, centroids):
+    """Assign each vector to its most similar centroid, in chunks."""
+    assignments = np.empty(len(vectors), dtype=np.int64)
+    for start in range(0, len(vectors), ASSIGN_CHUNK_SIZE):
+        chunk = vectors[start:start + ASSIGN_CHUNK_SIZE]
+        assignments[start:start + ASSIGN_CHUNK_SIZE] = np.argmax(chunk @ centroids.T, axis=1)
+    return assignments
+
+
+def spherical_kmeans(vectors, n_clusters, n_iter=10, seed=0):
+    """
+    Cluster unit vectors by cosine similarity.
+
+    Args:
+        vectors (numpy.ndarray): L2-normalized float32 vectors
+        n_clusters (int): Number of clusters
+        n_iter (int): Number of Lloyd iterations
+        seed (int): Random seed for centroid initialization
+
+    Returns:
+        numpy.ndarray: n_clusters x dim L2-normalized centroids
+    """
+    rng = np.random.default_rng(seed)
+    if len(vectors) > KMEANS_SAMPLE_SIZE:
+        vectors = vectors[np.sort(rng.choice(len(vectors), KMEANS_SAMPLE_SIZE, replace=False))]
+
+    n_clusters = max(1, min(n_clusters, len(vectors)))
+    centroids = np.array(vectors[rng.choice(len(vectors), n_clusters, replace=False)], dtype=np.float32)
+
+    for _ in range(n_iter):
+        assignments = _assign(vectors, centroids)
+        sums = np.zeros_like(centroids)
+        np.add.at(sums, assignments, vectors)
+        counts = np.bincount(assignments, minlength=n_clusters)
+        # Empty clusters keep their previous centroid
+        non_empty = counts > 0
+        centroids[non_empty] = _normalize_rows(sums[non_empty])
+
+    return centroids
+
+
+class DenseEmbeddingIndex:
+    """
+    IVF approximate nearest neighbour index over reduced TF-IDF embeddings.
+    """
+
+    def __init__(self, n_components=192, method="svd", n_lists=None, n_probe=8,
+                 embeddings_path=EMBEDDINGS_PATH, seed=0):
+        """
+        Initialize the dense index.
+
+        Args:
+            n_components (int): Embedding dimension, typically 128-256
+            method (str): "svd" for LSA or "random_projection"
+            n_lists (int, optional): Number of IVF partitions; defaults to
+                roughly the square root of the corpus size
+            n_probe (int): Partitions scanned per query; higher values give
+                better recall at higher latency
+            embeddings_path (str, optional): Where the memory-mapped embeddings
+                are written; None keeps them in memory
+            seed (int): Random seed for the reducer and k-means
+        """
+        if method not in ("svd", "random_projection"):
+            raise ValueError(f"Unknown embedding method: {method}")
+
+        self.n_components = n_components
+        self.method = method
+        self.n_lists = n_lists
+        self.n_probe = n_probe
+        self.embeddings_path = embeddings_path
+        self.seed = seed
+
+        self.reducer = None
+        self.centroids = None
+        self.embeddings = None
+        self.row_ids = None
+        self.list_offsets = None
+        self.live = None
+        self.source_version = None
+        self.source_vectorizer = None
+        # Documents added since the build, kept in memory: vectors, case
+        # index rows and assigned partitions
+        self.delta_vectors = None
+        self.delta_row_ids = None
+        self.delta_lists = None
+
+    def _make_reducer(self, doc_matrix):
+        """Create the dimensionality reducer for a document matrix."""
+        if self.method == "svd":
+            # TruncatedSVD needs strictly fewer components than features
+            n_components = max(1, min(self.n_components, doc_matrix.shape[1] - 1, doc_matrix.shape[0]))
+            return TruncatedSVD(n_components=n_components, random_state=self.seed)
+        # Dense output so embeddings and queries come back as arrays like TruncatedSVD's
+        return SparseRandomProjection(n_components=self.n_components, dense_output=True, random_state=self.seed)
+
+    def build(self, case_index):
+        """
+        Build the dense index from a fitted LegalCaseIndex.
+
+        Args:
+            case_index (LegalCaseIndex): Source index with a document matrix
+
+        Returns:
+            DenseEmbeddingIndex: The index itself, for chaining
+        """
+        doc_matrix = case_index.doc_matrix
+        self.reducer = self._make_reducer(doc_matrix)
+        vectors = _normalize_rows(self.reducer.fit_transform(doc_matrix))
+
+        n_lists = self.n_lists or max(1, int(np.sqrt(len(vectors))))
+        self.centroids = spherical_kmeans(vectors, n_lists, seed=self.seed)
+        assignments = _assign(vectors, self.centroids)
+
+        # Store vectors grouped by partition so each probe reads one
+        # contiguous slice of the memory map
+        order = np.argsort(assignments, kind="stable")
+        counts = np.bincount(assignments, minlength=len(self.centroids))
+        self.list_offsets = np.concatenate([[0], np.cumsum(counts)])
+        self.row_ids = order
+        self.embeddings = self._store(vectors[order])
+        self.live = case_index.live.copy()
+        self.source_version = case_index.version
+        self.source_vectorizer = case_index.vectorizer
+        self.delta_vectors = self.delta_row_ids = self.delta_lists = None
+        return self
+
+    def update(self, case_index):
+        """
+        Follow documents added to or removed from the case index since the build.
+
+        New rows are embedded with the fitted reducer and assigned to their
+        nearest partition; removed rows are masked. This index is left
+        unchanged for readers still using it.
+
+        Args:
+            case_index (LegalCaseIndex): A later version of the source index
+
+        Returns:
+            DenseEmbeddingIndex: The updated index, or None if the case index
+                was refitted since the build (vocabulary or rows changed) and
+                a full rebuild is needed
+        """
+        if case_index.doc_matrix is None or case_index.vectorizer is not self.source_vectorizer:
+            return None
+        n_rows = case_index.doc_matrix.shape[0]
+        n_known = len(self.live)
+        if n_rows < n_known:
+            return None
+
+        updated = copy.copy(self)
+        if n_rows > n_known:
+            vectors = self.embed(case_index.doc_matrix[n_known:])
+            row_ids = np.arange(n_known, n_rows)
+            lists = _assign(vectors, self.centroids)
+            if self.delta_vectors is not None:
+                vectors = np.vstack([self.delta_vectors, vectors])
+                row_ids = np.concatenate([self.delta_row_ids, row_ids])
+                lists = np.concatenate([self.delta_lists, lists])
+            updated.delta_vectors, updated.delta_row_ids, updated.delta_lists = vectors, row_ids, lists
+        updated.live = case_index.live.copy()
+        updated.source_version = case_index.version
+        return updated
+
+    def _store(self, vectors):
+        """Write embeddings to the memory-mapped file and reopen read-only."""
+        if not self.embeddings_path:
+            return vectors
+
+        directory = os.path.dirname(self.embeddings_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        # Write to a temporary file first and swap it in, so other sessions or
+        # workers that still map the previous embeddings keep reading that
+        # file unchanged instead of seeing it overwritten; the temporary name
+        # is unique per writer so concurrent rebuilds do not collide
+        tmp_path = f"{self.embeddings_path}.{os.getpid()}-{threading.get_ident()}.tmp"
+        mapped = np.lib.format.open_memmap(tmp_path, mode="w+", dtype=np.float32, shape=vectors.shape)
+        mapped[:] = vectors
+        mapped.flush()
+        del mapped
+        os.replace(tmp_path, self.embeddings_path)
+        return np.load(self.embeddings_path, mmap_mode="r")
+
+    def embed(self, query_vectors):
+        """
+        Project TF-IDF query vectors into the embedding space.
+
+        Args:
+            query_vectors (scipy.sparse.spmatrix): n_queries x n_terms matrix
+
+        Returns:
+            numpy.ndarray: L2-normalized float32 query embeddings
+        """
+        return _normalize_rows(self.reducer.transform(query_vectors))
+
+    def search(self, query_vector, top_k=5, n_probe=None, min_score=0.0):
+        """
+        Approximate top-k search for a single TF-IDF query vector.
+
+        Args:
+            query_vector (scipy.sparse.spmatrix): 1 x n_terms query vector
+            top_k (int): Number of top matches to return
+            n_probe (int, optional): Partitions to scan; defaults to self.n_probe
+            min_score (float): Only matches with similarity above this are returned
+
+        Returns:
+            list: (document index, similarity) tuples, best match first
+        """
+        if self.embeddings is None or len(self.row_ids) == 0:
+            return []
+
+        query = self.embed(query_vector)[0]
+        n_probe = min(n_probe or self.n_probe, len(self.centroids))
+        probes = top_k_indices(self.centroids @ query, n_probe)
+
+        rows = []
+        scores = []
+        for probe in probes:
+            start, end = self.list_offsets[probe], self.list_offsets[probe + 1]
+            if start == end:
+                continue
+            rows.append(self.row_ids[start:end])
+            scores.append(self.embeddings[start:end] @ query)
+        if self.delta_vectors is not None:
+            probed = np.isin(self.delta_lists, probes)
+            if probed.any():
+                rows.append(self.delta_row_ids[probed])
+                scores.append(self.delta_vectors[probed] @ query)
+        if not rows:
+            return []
+
+        rows = np.concatenate(rows)
+        scores = np.concatenate(scores)
+        keep = self.live[rows] & (scores > min_score)
+        rows, scores = rows[keep], scores[keep]
+
+        best = top_k_indices(scores, top_k)
+        return [(int(rows[idx]), float(scores[idx])) for idx in best]
+
+
+def compare_with_exact(case_index, dense_index, processed_queries, top_k=10, n_probe_values=(1, 2, 4, 8, 16, 32)):
+    """
+    Measure recall and latency of the dense index against exact search.
+
+    Args:
+        case_index (LegalCaseIndex): Index used for exact search
+        dense_index (DenseEmbeddingIndex): Index built from case_index
+        processed_queries (list): Preprocessed query texts
+        top_k (int): Number of results compared per query
+        n_probe_values (tuple): n_probe settings to evaluate
+
+    Returns:
+        list: One dictionary per n_probe with recall@k and mean latencies in ms
+    """
+    query_vectors = [case_index.transform(query) for query in processed_queries]
+
+    start = time.perf_counter()
+    exact = [
+        {idx for idx, _ in case_index.inverted_index.top_k(vector, top_k, live=case_index.live)}
+        for vector in query_vectors
+    ]
+    exact_ms = (time.perf_counter() - start) * 1000 / max(len(query_vectors), 1)
+
+    report = []
+    for n_probe in n_probe_values:
+        start = time.perf_counter()
+        approximate = [
+            {idx for idx, _ in dense_index.search(vector, top_k, n_probe=n_probe)}
+            for vector in query_vectors
+        ]
+        ann_ms = (time.perf_counter() - start) * 1000 / max(len(query_vectors), 1)
+
+        hits = sum(len(found & expected) for found, expected in zip(approximate, exact))
+        total = sum(len(expected) for expected in exact)
+        report.append({
+            "n_probe": n_probe,
+            "recall": hits / total if total else 1.0,
+            "ann_ms": ann_ms,
+            "exact_ms": exact_ms
+        })
+
+    return report
@@ -4,6 +4,11 @@ import numpy as np
 import os
 import datetime
 from utils import load_svg
+from registry import prewarm
+
+# Build the predictor, argument generator and case matcher in the background
+# so the first request to a page that uses them does not wait
+prewarm()
 
 # Configure the page
 st.set_page_config(
@@ -1,27 +1,11 @@
-import nltk
-from nltk.tokenize import word_tokenize
 import re
 import random
 from legal_data import (
     ipc_sections, it_act_sections, mv_act_sections, 
-    legal_precedents, get_offense_details, get_precedents_for_section
+    legal_precedents, get_offense_details, get_precedent_store
 )
-
-# Ensure NLTK data is downloaded
-try:
-    nltk.data.find('tokenizers/punkt')
-except LookupError:
-    try:
-        nltk.download('punkt', quiet=True)
-    except Exception as e:
-        print(f"Warning: Failed to download NLTK data: {e}")
-        print("The application will continue with limited functionality.")
-
-# Initialize tokenizer with fallback
-try:
-    word_tokenize("test")
-except Exception as e:
-    print(f"Warning: Tokenization may be limited: {e}")
+from nltk_resources import word_tokenize
+from registry import LazySingleton
 
 class ArgumentGenerator:
     """
@@ -35,6 +19,7 @@ class ArgumentGenerator:
         self.it_act_sections = it_act_sections
         self.mv_act_sections = mv_act_sections
         self.legal_precedents = legal_precedents
+        self.precedent_store = get_precedent_store()
         
         # Common argument templates
         self.argument_templates = self._load_argument_templates()
@@ -121,7 +106,11 @@ class ArgumentGenerator:
         ]
         
         # Extract specific elements from case description
-        tokens = word_tokenize(case_description.lower())
+        try:
+            tokens = word_tokenize(case_description.lower())
+        except LookupError:
+            # Tokenizer models unavailable (e.g. offline); continue with limited functionality
+            tokens = case_description.lower().split()
         
         # Look for certain patterns in the description
         if "threat" in tokens or "intimidate" in tokens or "fear" in tokens:
@@ -206,7 +195,7 @@ class ArgumentGenerator:
             return {"error": f"Section {section} not found in {act}"}
         
         # Get relevant precedents
-        precedents = get_precedents_for_section(section, act)
+        precedents = self.precedent_store.for_section(section, act)
         
         # Get case elements
         elements = self._get_case_elements(section, act, case_description)
@@ -251,7 +240,8 @@ class ArgumentGenerator:
         return {
             "arguments": arguments,
             "offense_details": offense_details,
-            "supporting_precedents": precedents if precedents else [],
+            # Store records are read-only and shared, so return plain copies
+            "supporting_precedents": [dict(p, key_points=list(p["key_points"])) for p in precedents],
             "position": "defense" if favor_defense else "prosecution"
         }
     
@@ -282,7 +272,7 @@ class ArgumentGenerator:
         bail_info = offense_details.get("bail_info", {})
         
         # Get relevant precedents
-        precedents = get_precedents_for_section(section, act)
+        precedents = self.precedent_store.for_section(section, act)
         
         # Select appropriate templates
         templates = self.argument_templates["bail_favor"] if favor_bail else self.argument_templates["bail_against"]
@@ -309,10 +299,11 @@ class ArgumentGenerator:
         return {
             "bail_arguments": arguments,
             "offense_details": offense_details,
-            "is_bailable": "bailable" in str(bail_info).lower(),
-            "supporting_precedents": precedents if precedents else [],
+            "is_bailable": offense_details["bail_type"] == "bailable",
+            # Store records are read-only and shared, so return plain copies
+            "supporting_precedents": [dict(p, key_points=list(p["key_points"])) for p in precedents],
             "position": "favor" if favor_bail else "against"
         }
 
-# Initialize the argument generator
-argument_generator = ArgumentGenerator()
+# The argument generator is built on first use (or by registry.prewarm)
+argument_generator = LazySingleton("argument_generator", ArgumentGenerator)
@@ -0,0 +1,112 @@
+"""
+Performance benchmarks for the legal search pipeline.
+
+Usage:
+    python benchmarks.py preprocess [--corpus PATH] [--docs N] [--words N]
+
+Without --corpus a synthetic judgment corpus is generated from the sample
+precedents and section titles in legal_data. PATH may be a directory of .txt
+files or a single text file with one document per line.
+"""
+
+import argparse
+import os
+import random
+import re
+import time
+
+from semantic_search import LEGAL_PHRASES, legal_case_matcher
+
+
+def legacy_preprocess_text(text):
+    """The multi-pass preprocessing EnhancedLegalCaseMatcher used before the compiled normalizer."""
+    if not text:
+        return ""
+    text = text.lower()
+    text = re.sub(r'section\s+(\d+)', r'section_\1', text)
+    for phrase in LEGAL_PHRASES:
+        if phrase in text:
+            text = text.replace(phrase, phrase.replace(" ", "_"))
+    text = re.sub(r'[^\w\s_]', ' ', text)
+    text = re.sub(r'\s+', ' ', text).strip()
+    return text
+
+
+def load_corpus(path):
+    """Load documents from a directory of .txt files or a one-document-per-line file."""
+    if os.path.isdir(path):
+        documents = []
+        for name in sorted(os.listdir(path)):
+            if name.endswith(".txt"):
+                with open(os.path.join(path, name), "r", encoding="utf-8", errors="ignore") as f:
+                    documents.append(f.read())
+        return documents
+
+    with open(path, "r", encoding="utf-8", errors="ignore") as f:
+        return [line for line in f if line.strip()]
+
+
+def synthetic_corpus(num_docs, words_per_doc, seed=0):
+    """Generate judgment-like documents from the sample legal data."""
+    from legal_data import ipc_sections, it_act_sections, mv_act_sections, legal_precedents
+
+    rng = random.Random(seed)
+    sentences = []
+    for precedent in legal_precedents:
+        sentences.append(precedent["summary"])
+        sentences.extend(precedent["key_points"])
+    for sections in (ipc_sections, it_act_sections, mv_act_sections):
+        for section, title in sections.items():
+            sentences.append(f"The accused was charged under Section {section} ({title}).")
+    sentences.extend(f"The prosecution must prove {phrase} in this case." for phrase in LEGAL_PHRASES)
+
+    documents = []
+    for _ in range(num_docs):
+        words = []
+        while len(words) < words_per_doc:
+            words.extend(rng.choice(sentences).split())
+        documents.append(" ".join(words[:words_per_doc]))
+    return documents
+
+
+def _time(function, documents, repeat=3):
+    """Return the best wall-clock time of applying function to every document."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for document in documents:
+            function(document)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def benchmark_preprocess(documents):
+    """Compare legacy and compiled preprocessing throughput on a corpus."""
+    total_mb = sum(len(document) for document in documents) / (1024 * 1024)
+    legacy = _time(legacy_preprocess_text, documents)
+    compiled = _time(legal_case_matcher.preprocess_text, documents)
+
+    print(f"Corpus: {len(documents)} documents, {total_mb:.1f} MB")
+    print(f"Legacy preprocess:   {legacy:.3f}s ({total_mb / legacy:.1f} MB/s)")
+    print(f"Compiled normalizer: {compiled:.3f}s ({total_mb / compiled:.1f} MB/s)")
+    print(f"Speedup: {legacy / compiled:.2f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Legal search performance benchmarks")
+    subparsers = parser.add_subparsers(dest="benchmark", required=True)
+
+    preprocess = subparsers.add_parser("preprocess", help="Text preprocessing throughput")
+    preprocess.add_argument("--corpus", help="Directory of .txt files or one-document-per-line file")
+    preprocess.add_argument("--docs", type=int, default=2000, help="Synthetic corpus size")
+    preprocess.add_argument("--words", type=int, default=3000, help="Words per synthetic document")
+
+    args = parser.parse_args()
+
+    if args.benchmark == "preprocess":
+        documents = load_corpus(args.corpus) if args.corpus else synthetic_corpus(args.docs, args.words)
+        benchmark_preprocess(documents)
+
+
+if __name__ == "__main__":
+    main()
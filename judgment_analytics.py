@@ -0,0 +1,235 @@
+"""
+Precomputed aggregates over the judgments dataset.
+
+Aggregates that do not depend on a user's search are computed once per
+judgments data version with vectorized pandas operations and cached for the
+whole process, so pages look them up instead of recomputing them on every
+rerun.
+
+The judicial analytics dashboard rollups are also materialized to disk,
+either ahead of time:
+
+    python judgment_analytics.py [--output PATH]
+
+or automatically the first time they are requested after the judgments
+change, so other workers and restarts only read them.
+"""
+
+import argparse
+import os
+import pickle
+import threading
+import time
+from collections import Counter
+from itertools import combinations
+
+import numpy as np
+import pandas as pd
+
+from judgments_store import data_version, get_judgments
+
+# Materialized judicial analytics rollups
+ANALYTICS_CUBES_PATH = os.path.join("assets", "index", "analytics_cubes.pkl")
+
+# Reentrant because aggregates may be built from other cached aggregates
+_lock = threading.RLock()
+# Aggregate name -> (data version, value)
+_cache = {}
+
+
+def _cached(name, build, needs_judgments=True):
+    """
+    Return an aggregate for the current data version, building it if needed.
+
+    Args:
+        name (str): Aggregate name
+        build (callable): Computes the aggregate from the judgments DataFrame
+        needs_judgments (bool): False if build takes no arguments and loads
+            the judgments itself only when it has to
+
+    Returns:
+        The cached aggregate
+    """
+    version = data_version()
+    entry = _cache.get(name)
+    if entry is not None and entry[0] == version:
+        return entry[1]
+
+    with _lock:
+        entry = _cache.get(name)
+        if entry is None or entry[0] != version:
+            entry = (version, build(get_judgments()) if needs_judgments else build())
+            _cache[name] = entry
+    return entry[1]
+
+
+def _judge_language_shares(df):
+    """Judge x language table of each judge's share of judgments per language."""
+    counts = pd.crosstab(df["judgement_by"], df["language"])
+    # Shares are of all the judge's judgments, including those with no language
+    totals = df["judgement_by"].value_counts()
+    shares = counts.div(totals.reindex(counts.index), axis=0)
+    return shares.where(counts > 0)
+
+
+def judge_language_shares():
+    """
+    Get each judge's distribution of judgments over languages.
+
+    Returns:
+        pd.DataFrame: Judges x languages; a cell is the fraction of the judge's
+            judgments in that language, NaN if there are none
+    """
+    return _cached("judge_language_shares", _judge_language_shares)
+
+
+def _multilingual_judges(df):
+    """Judges with judgments in more than one language and their distributions."""
+    shares = judge_language_shares()
+    multilingual = shares[shares.notna().sum(axis=1) > 1]
+    return [
+        {"Judge": judge, "Language Distribution": distribution.dropna().to_dict()}
+        for judge, distribution in multilingual.iterrows()
+    ]
+
+
+def multilingual_judges():
+    """
+    Get the judges who have delivered judgments in more than one language.
+
+    Returns:
+        list: Dicts with "Judge" and "Language Distribution" (language ->
+            share of the judge's judgments), ordered by judge
+    """
+    return _cached("multilingual_judges", _multilingual_judges)
+
+
+def _bench_pairs(bench, top_n=10):
+    """Most common pairs of judges sitting together, counted per distinct bench."""
+    # Distinct bench strings in order of first appearance, so ties rank the
+    # same as counting row by row
+    codes, uniques = pd.factorize(bench.astype(object), use_na_sentinel=True)
+    counts = np.bincount(codes[codes >= 0], minlength=len(uniques))
+
+    pair_counts = Counter()
+    for bench_str, count in zip(uniques, counts):
+        judges = sorted(judge.strip() for judge in bench_str.split(","))
+        for pair in combinations(judges, 2):
+            pair_counts[pair] += int(count)
+
+    combo_df = pd.DataFrame(pair_counts.most_common(top_n), columns=["Combination", "Count"])
+    combo_df["Judges"] = combo_df["Combination"].apply(lambda x: " & ".join(x))
+    return combo_df
+
+
+def build_cubes(df):
+    """
+    Compute the rollups shown on the judicial analytics dashboard.
+
+    Args:
+        df (pd.DataFrame): Judgments as returned by get_judgments()
+
+    Returns:
+        dict: Small tables and statistics, keyed by name
+    """
+    judge_counts = df["judgement_by"].value_counts()
+    top_judges = judge_counts.head(5).index
+
+    timeline = df[df["judgement_by"].isin(top_judges)]
+    judge_timeline = timeline.groupby(["year", "judgement_by"], observed=True).size().reset_index(name="count")
+
+    return {
+        "yearly_counts": df.groupby("year").size().reset_index(name="count"),
+        "type_counts": df["Judgement_type"].value_counts(),
+        "top_judges": judge_counts.head(10),
+        "timeline_judges": list(top_judges),
+        "judge_timeline": judge_timeline,
+        "bench_pairs": _bench_pairs(df["bench"]),
+        "top_petitioners": df["pet"].value_counts().head(10),
+        "top_respondents": df["res"].value_counts().head(10),
+        "summary": {
+            "total_judgments": len(df),
+            "unique_judges": df["judgement_by"].nunique(),
+            "average_per_year": round(len(df) / df["year"].nunique(), 2) if df["year"].nunique() else 0.0,
+            "judgment_types": df["Judgement_type"].nunique()
+        }
+    }
+
+
+def materialize_cubes(path=ANALYTICS_CUBES_PATH, df=None):
+    """
+    Compute the dashboard rollups and save them for the current data version.
+
+    Args:
+        path (str): Where to save the rollups
+        df (pd.DataFrame, optional): Judgments; loaded if not given
+
+    Returns:
+        dict: The rollups
+    """
+    version = data_version()
+    cubes = build_cubes(get_judgments() if df is None else df)
+
+    # Write to a temporary file first so readers never see a partial file;
+    # the temporary name is unique per writer so concurrent writes do not collide
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}-{threading.get_ident()}.tmp"
+    with open(tmp_path, "wb") as f:
+        pickle.dump({"version": version, "cubes": cubes}, f)
+    os.replace(tmp_path, path)
+    return cubes
+
+
+def _load_cubes(path=ANALYTICS_CUBES_PATH):
+    """
+    Load the saved rollups if they match the data, else rebuild and save them.
+
+    The judgments are only loaded for a rebuild, so a current file is read
+    without parsing the dataset.
+    """
+    version = data_version()
+    if os.path.exists(path):
+        try:
+            with open(path, "rb") as f:
+                saved = pickle.load(f)
+            if saved.get("version") == version:
+                return saved["cubes"]
+        except Exception as e:
+            print(f"Error loading analytics cubes: {str(e)}")
+
+    # Data changed since the rollups were materialized
+    df = get_judgments()
+    try:
+        return materialize_cubes(path, df)
+    except OSError as e:
+        print(f"Error saving analytics cubes: {str(e)}")
+        return build_cubes(df)
+
+
+def analytics_cubes():
+    """
+    Get the judicial analytics rollups for the current data version.
+
+    They are read from the materialized file when it is current, and
+    recomputed and saved when the judgments have changed.
+
+    Returns:
+        dict: Rollups as returned by build_cubes
+    """
+    return _cached("analytics_cubes", _load_cubes, needs_judgments=False)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Materialize judicial analytics rollups")
+    parser.add_argument("--output", default=ANALYTICS_CUBES_PATH, help="Where to save the rollups")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    cubes = materialize_cubes(args.output)
+    elapsed = time.perf_counter() - start
+    print(f"Materialized {len(cubes)} rollups for data version {data_version()} "
+          f"to {args.output} in {elapsed:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
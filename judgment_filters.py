@@ -0,0 +1,203 @@
+"""
+Indexed filters for judgment search.
+
+Each searchable text field is factorized into distinct values, casefolded
+once, and the distinct values go into a trigram inverted index. A substring
+predicate intersects the postings of the query's trigrams to get candidate
+values, confirms them with an exact substring test, and expands them to a
+row bitmap through the factorized codes in one vectorized lookup. Bitmaps
+from all predicates are then intersected.
+
+Judge, bench and advocate columns repeat a small set of names, so the
+expensive part of a search depends on the number of distinct values rather
+than the number of rows, and the per-row work is a single array lookup.
+
+Matching is case-insensitive and literal (no regular expressions).
+"""
+
+import threading
+
+import numpy as np
+import pandas as pd
+
+from judgments_store import data_version, get_judgments
+
+# Text columns with a trigram index
+TEXT_FIELDS = ("bench", "judgement_by", "pet", "res", "pet_adv", "res_adv")
+
+# Queries shorter than this scan the distinct values instead of the index
+NGRAM_SIZE = 3
+
+_lock = threading.Lock()
+_engine = None
+_engine_version = None
+
+
+class TrigramFieldIndex:
+    """
+    A trigram index over the distinct values of one text column.
+    """
+
+    def __init__(self, values):
+        """
+        Build the index.
+
+        Args:
+            values (pd.Series): Column values; missing values never match
+        """
+        codes, uniques = pd.factorize(values.astype(object), use_na_sentinel=True)
+        # Row -> distinct value id, -1 for missing values
+        self.codes = codes
+        self.values = [str(value).casefold() for value in uniques]
+
+        postings = {}
+        for value_id, text in enumerate(self.values):
+            for gram in {text[i:i + NGRAM_SIZE] for i in range(len(text) - NGRAM_SIZE + 1)}:
+                postings.setdefault(gram, []).append(value_id)
+        self.postings = {gram: np.array(ids, dtype=np.int32) for gram, ids in postings.items()}
+
+    def candidate_values(self, query):
+        """
+        Ids of distinct values that may contain query.
+
+        Args:
+            query (str): Casefolded query
+
+        Returns:
+            np.ndarray or range: Candidate value ids
+        """
+        if len(query) < NGRAM_SIZE:
+            return range(len(self.values))
+
+        grams = {query[i:i + NGRAM_SIZE] for i in range(len(query) - NGRAM_SIZE + 1)}
+        postings = []
+        for gram in grams:
+            posting = self.postings.get(gram)
+            if posting is None:
+                return range(0)
+            postings.append(posting)
+
+        postings.sort(key=len)
+        candidates = postings[0]
+        for posting in postings[1:]:
+            candidates = np.intersect1d(candidates, posting, assume_unique=True)
+            if not len(candidates):
+                break
+        return candidates
+
+    def mask(self, query):
+        """
+        Rows whose value contains query, case-insensitively.
+
+        Args:
+            query (str): Substring to look for
+
+        Returns:
+            np.ndarray: Boolean row bitmap
+        """
+        query = query.casefold()
+        # One extra False slot so that missing values (code -1) never match
+        value_mask = np.zeros(len(self.values) + 1, dtype=bool)
+        for value_id in self.candidate_values(query):
+            if query in self.values[value_id]:
+                value_mask[value_id] = True
+        return value_mask[self.codes]
+
+
+class JudgmentFilterEngine:
+    """
+    Prebuilt filter indexes over the judgments.
+    """
+
+    def __init__(self, df):
+        """
+        Index a judgments DataFrame.
+
+        Args:
+            df (pd.DataFrame): Judgments as returned by get_judgments()
+        """
+        self.size = len(df)
+        self.fields = {field: TrigramFieldIndex(df[field]) for field in TEXT_FIELDS if field in df.columns}
+        self.columns = {column: df[column] for column in ("Judgement_type", "language") if column in df.columns}
+        self.dates = df["judgment_dates"].to_numpy()
+
+    def contains(self, fields, query):
+        """
+        Rows where any of the fields contains query.
+
+        Args:
+            fields (tuple): Indexed text fields
+            query (str): Substring to look for
+
+        Returns:
+            np.ndarray: Boolean row bitmap
+        """
+        mask = np.zeros(self.size, dtype=bool)
+        for field in fields:
+            mask |= self.fields[field].mask(query)
+        return mask
+
+    def search(self, judge=None, judgment_type=None, language=None, parties=(),
+               advocate=None, bench=None, start_date=None, end_date=None):
+        """
+        Find judgments matching all of the given filters.
+
+        Args:
+            judge (str, optional): Substring of the bench or the judge
+            judgment_type (str, optional): Exact judgment type
+            language (str, optional): Exact language
+            parties (list): Substrings of the petitioner or respondent; a row
+                matches if it contains any of them
+            advocate (str, optional): Substring of either party's advocate
+            bench (str, optional): Substring of the bench
+            start_date (datetime, optional): Earliest judgment date
+            end_date (datetime, optional): Latest judgment date
+
+        Returns:
+            np.ndarray: Positions of matching rows, in data order
+        """
+        mask = np.ones(self.size, dtype=bool)
+
+        if judgment_type is not None:
+            mask &= (self.columns["Judgement_type"] == judgment_type).to_numpy(dtype=bool, na_value=False)
+        if language is not None:
+            mask &= (self.columns["language"] == language).to_numpy(dtype=bool, na_value=False)
+        if start_date is not None:
+            mask &= self.dates >= np.datetime64(pd.Timestamp(start_date))
+        if end_date is not None:
+            mask &= self.dates <= np.datetime64(pd.Timestamp(end_date))
+
+        if judge:
+            mask &= self.contains(("bench", "judgement_by"), judge)
+        if parties:
+            party_mask = np.zeros(self.size, dtype=bool)
+            for party in parties:
+                party_mask |= self.contains(("pet", "res"), party)
+            mask &= party_mask
+        if advocate:
+            mask &= self.contains(("pet_adv", "res_adv"), advocate)
+        if bench:
+            mask &= self.fields["bench"].mask(bench)
+
+        return np.flatnonzero(mask)
+
+
+def get_filter_engine():
+    """
+    Get the filter engine for the current judgments, rebuilding it when the
+    data changes.
+
+    Returns:
+        JudgmentFilterEngine: Shared engine
+    """
+    global _engine, _engine_version
+
+    version = data_version()
+    if _engine is not None and _engine_version == version:
+        return _engine
+
+    with _lock:
+        if _engine is None or _engine_version != version:
+            _engine = JudgmentFilterEngine(get_judgments())
+            _engine_version = version
+    return _engine
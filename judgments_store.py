@@ -0,0 +1,182 @@
+"""
+Shared access to the judgments dataset (assets/judgments.csv).
+
+The CSV is parsed once into a typed columnar Feather file next to the other
+derived indexes: dates parsed, low-cardinality columns (judge, bench,
+language, judgment type) stored as categoricals and year/month precomputed.
+The Feather file is memory-mapped on load and converted again only when the
+CSV changes.
+
+Every page gets the same process-wide DataFrame from get_judgments(), so a
+worker holds one copy of the data however many pages and sessions use it.
+The frame is shared: filter or copy it, never modify it in place.
+
+data_version() identifies the current CSV contents; caches derived from the
+judgments (filter indexes, analytics rollups) are keyed by it.
+"""
+
+import os
+import threading
+
+import pandas as pd
+
+JUDGMENTS_CSV = os.path.join("assets", "judgments.csv")
+JUDGMENTS_FEATHER = os.path.join("assets", "index", "judgments.feather")
+
+# Format of the judgment_dates column in the CSV
+DATE_FORMAT = "%d-%m-%Y"
+
+# Low-cardinality text columns stored as categoricals
+CATEGORICAL_COLUMNS = ["judgement_by", "bench", "language", "Judgement_type"]
+
+# Feather schema metadata key holding the data version of the source CSV
+_VERSION_KEY = b"judgments_data_version"
+
+_lock = threading.Lock()
+_frame = None
+_frame_version = None
+
+
+def judgments_available(csv_path=JUDGMENTS_CSV):
+    """Whether the judgments CSV exists."""
+    return os.path.exists(csv_path)
+
+
+def data_version(csv_path=JUDGMENTS_CSV):
+    """
+    Identify the current contents of the judgments CSV.
+
+    Args:
+        csv_path (str): Path of the CSV
+
+    Returns:
+        str: Changes whenever the file is replaced or modified
+    """
+    stat = os.stat(csv_path)
+    return f"{stat.st_size}-{stat.st_mtime_ns}"
+
+
+def read_judgments_csv(csv_path=JUDGMENTS_CSV):
+    """
+    Parse the judgments CSV into a typed DataFrame.
+
+    Args:
+        csv_path (str): Path of the CSV
+
+    Returns:
+        pd.DataFrame: Judgments with parsed dates, categorical columns and
+            year/month columns
+    """
+    df = pd.read_csv(csv_path)
+    df.columns = [column.strip() for column in df.columns]
+
+    df["judgment_dates"] = pd.to_datetime(df["judgment_dates"], format=DATE_FORMAT, errors="coerce")
+    df["year"] = df["judgment_dates"].dt.year
+    df["month"] = df["judgment_dates"].dt.month
+
+    for column in CATEGORICAL_COLUMNS:
+        if column in df.columns:
+            df[column] = df[column].astype("category")
+    return df
+
+
+def convert_to_feather(csv_path=JUDGMENTS_CSV, feather_path=JUDGMENTS_FEATHER):
+    """
+    Convert the judgments CSV to the typed Feather file.
+
+    Args:
+        csv_path (str): Path of the CSV
+        feather_path (str): Path of the Feather file to write
+
+    Returns:
+        pd.DataFrame: The converted judgments
+    """
+    import pyarrow as pa
+    import pyarrow.feather as feather
+
+    version = data_version(csv_path)
+    df = read_judgments_csv(csv_path)
+
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    metadata = dict(table.schema.metadata or {})
+    metadata[_VERSION_KEY] = version.encode()
+    table = table.replace_schema_metadata(metadata)
+
+    # Write to a temporary file first so readers never see a partial file;
+    # uncompressed so the file can be memory-mapped
+    os.makedirs(os.path.dirname(feather_path), exist_ok=True)
+    tmp_path = f"{feather_path}.{os.getpid()}-{threading.get_ident()}.tmp"
+    feather.write_feather(table, tmp_path, compression="uncompressed")
+    os.replace(tmp_path, feather_path)
+    return df
+
+
+def _read_feather(feather_path, version):
+    """Memory-map the Feather file if it was converted from this CSV version."""
+    import pyarrow.feather as feather
+
+    if not os.path.exists(feather_path):
+        return None
+    try:
+        table = feather.read_table(feather_path, memory_map=True)
+    except Exception as e:
+        print(f"Error reading judgments cache: {str(e)}")
+        return None
+
+    if (table.schema.metadata or {}).get(_VERSION_KEY) != version.encode():
+        return None
+    return table.to_pandas()
+
+
+def load_judgments(csv_path=JUDGMENTS_CSV, feather_path=JUDGMENTS_FEATHER):
+    """
+    Load the judgments, from the Feather file when it is current.
+
+    Without pyarrow the CSV is parsed directly.
+
+    Args:
+        csv_path (str): Path of the CSV
+        feather_path (str): Path of the Feather file
+
+    Returns:
+        pd.DataFrame: Typed judgments
+    """
+    try:
+        import pyarrow
+    except ImportError:
+        return read_judgments_csv(csv_path)
+
+    df = _read_feather(feather_path, data_version(csv_path))
+    if df is None:
+        try:
+            df = convert_to_feather(csv_path, feather_path)
+        except OSError as e:
+            print(f"Error writing judgments cache: {str(e)}")
+            df = read_judgments_csv(csv_path)
+    return df
+
+
+def get_judgments(csv_path=JUDGMENTS_CSV):
+    """
+    Get the process-wide judgments DataFrame, reloading it if the CSV changed.
+
+    Args:
+        csv_path (str): Path of the CSV
+
+    Returns:
+        pd.DataFrame: Shared judgments; do not modify in place
+
+    Raises:
+        FileNotFoundError: If the CSV does not exist
+    """
+    global _frame, _frame_version
+
+    version = data_version(csv_path)
+    if _frame is not None and _frame_version == version:
+        return _frame
+
+    with _lock:
+        if _frame is None or _frame_version != version:
+            _frame = load_judgments(csv_path)
+            _frame_version = version
+    return _frame
@@ -1,7 +1,7 @@
-import pandas as pd
-import numpy as np
+import functools
 import json
 import re
+from types import MappingProxyType
 
 # Define key legal acts and their important sections
 ipc_sections = {
@@ -179,6 +179,72 @@ defendant_rights = {
     ]
 }
 
+# Defense options: "common" applies to every case, the rest are keyed by act and section
+defense_options = {
+    "common": [
+        "Challenge the admissibility of evidence",
+        "Question witness credibility",
+        "Establish alibi",
+        "Claim lack of intent (mens rea)",
+        "Procedural violations in investigation"
+    ],
+    "IPC": {
+        "302": [  # Murder
+            "Self-defense",
+            "Accident or misfortune without criminal intention",
+            "Sudden and grave provocation",
+            "Mental disability or insanity",
+            "Challenge cause of death"
+        ],
+        "376": [  # Rape
+            "Consent defense",
+            "Challenge identification",
+            "Medical evidence inconsistencies",
+            "Alibi defense",
+            "Delay in filing FIR"
+        ],
+        "420": [  # Cheating
+            "No fraudulent or dishonest intention",
+            "Civil dispute, not criminal matter",
+            "Legitimate business transaction",
+            "No inducement to deliver property",
+            "Lack of deception"
+        ]
+    },
+    "IT Act": {
+        "66": [  # Computer-related offenses
+            "Authorized access",
+            "Legitimate security testing",
+            "No damage or harm caused",
+            "Challenge technical evidence",
+            "Challenge chain of custody for electronic evidence"
+        ],
+        "67": [  # Obscene material
+            "Content not obscene by legal standards",
+            "Freedom of expression defense",
+            "No intent to publish/transmit",
+            "Account was hacked",
+            "Educational or scientific purpose"
+        ]
+    },
+    "MV Act": {
+        "184": [  # Dangerous driving
+            "Challenge speed measurement accuracy",
+            "Road conditions defense",
+            "Medical emergency",
+            "Vehicle mechanical failure",
+            "Necessary evasive action"
+        ],
+        "185": [  # Drunk driving
+            "Challenge breathalyzer calibration",
+            "Improper testing procedure",
+            "Medical condition affecting test",
+            "Consumption after driving (hip flask defense)",
+            "Necessity in emergency"
+        ]
+    }
+}
+
 # Sample legal precedents from Indian Supreme Court
 legal_precedents = [
     {
@@ -380,93 +446,125 @@ jurisdiction_types = {
     }
 }
 
-def get_offense_details(section, act="IPC"):
+# Section tables by act name, in search result order
+act_sections = {
+    "IPC": ipc_sections,
+    "CrPC": crpc_sections,
+    "CPC": cpc_sections,
+    "Evidence Act": evidence_act_sections,
+    "IT Act": it_act_sections,
+    "MV Act": mv_act_sections
+}
+
+# Sections typically considered non-bailable, by act
+non_bailable_sections = {
+    "IPC": frozenset(["302", "304", "304B", "307", "326", "376", "377", "392", "395", "396", "498A"]),
+    "IT Act": frozenset(["66F", "67", "67A", "67B"]),
+    "MV Act": frozenset(["185", "187", "189"])
+}
+
+# Himachal Pradesh environmental and wildlife acts with special bail guidelines
+himachal_bail_acts = frozenset(["Wildlife Protection Act", "Forest Conservation Act", "HP Forest Act"])
+
+def _freeze(value):
     """
-    Get details about a specific offense based on section number and act.
+    Return a read-only copy of nested dicts and lists, so records can be
+    shared between callers without one of them modifying it for the others.
     """
-    section_str = str(section)
-    
-    if act == "IPC":
-        sections_dict = ipc_sections
-    elif act == "IT Act":
-        sections_dict = it_act_sections
-    elif act == "MV Act":
-        sections_dict = mv_act_sections
-    elif act == "CrPC":
-        sections_dict = crpc_sections
-    elif act == "CPC":
-        sections_dict = cpc_sections
-    elif act == "Evidence Act":
-        sections_dict = evidence_act_sections
-    else:
-        return None
-    
-    if section_str in sections_dict:
-        return {
-            "section": section_str,
-            "act": act,
-            "title": sections_dict[section_str],
-            "rights": defendant_rights["general"],
-            "bail_info": get_bail_information(section_str, act)
-        }
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+def _himachal_bail_information():
+    """
+    Bail information for Himachal Pradesh specific acts.
+    """
+    categories = bail_guidelines["himachal_specific"]["categories"]
+    for category in ["environmental", "wildlife", "tribal_rights"]:
+        if category in categories:
+            return {
+                "category": category,
+                "guidelines": categories[category],
+                "general_guidelines": bail_guidelines["himachal_specific"]["general_guidelines"]
+            }
     return None
 
+# Shared read-only bail information records
+_bail_records = {
+    "bailable": _freeze(bail_guidelines["bailable"]),
+    "non_bailable": _freeze(bail_guidelines["non_bailable"]),
+    "himachal_specific": _freeze(_himachal_bail_information())
+}
+
+def get_bail_type(section, act="IPC"):
+    """
+    Classify a section as "bailable" or "non_bailable".
+    """
+    return "non_bailable" if str(section) in non_bailable_sections.get(act, ()) else "bailable"
+
 def get_bail_information(section, act="IPC"):
     """
     Get bail information for a specific section.
     This is a simplified implementation.
+    
+    Returns a shared, read-only record; copy it before modifying.
     """
     # In a real system, this would be based on a comprehensive database
     # This is simplified for demonstration purposes
     
-    # Sections typically considered non-bailable in IPC
-    ipc_non_bailable = ["302", "304", "304B", "307", "326", "376", "377", "392", "395", "396", "498A"]
-    it_non_bailable = ["66F", "67", "67A", "67B"]
-    mv_non_bailable = ["185", "187", "189"]
-    
     # Himachal Pradesh specific environmental and wildlife cases
-    if act in ["Wildlife Protection Act", "Forest Conservation Act", "HP Forest Act"]:
-        # Check if case falls under special categories defined in bail_guidelines["himachal_specific"]
-        if "environmental" in bail_guidelines["himachal_specific"]["categories"]:
-            return {
-                "category": "environmental",
-                "guidelines": bail_guidelines["himachal_specific"]["categories"]["environmental"],
-                "general_guidelines": bail_guidelines["himachal_specific"]["general_guidelines"]
-            }
-        elif "wildlife" in bail_guidelines["himachal_specific"]["categories"]:
-            return {
-                "category": "wildlife",
-                "guidelines": bail_guidelines["himachal_specific"]["categories"]["wildlife"],
-                "general_guidelines": bail_guidelines["himachal_specific"]["general_guidelines"]
-            }
-        elif "tribal_rights" in bail_guidelines["himachal_specific"]["categories"]:
-            return {
-                "category": "tribal_rights",
-                "guidelines": bail_guidelines["himachal_specific"]["categories"]["tribal_rights"],
-                "general_guidelines": bail_guidelines["himachal_specific"]["general_guidelines"]
-            }
+    if act in himachal_bail_acts and _bail_records["himachal_specific"] is not None:
+        return _bail_records["himachal_specific"]
     
-    if act == "IPC" and section in ipc_non_bailable:
-        return bail_guidelines["non_bailable"]
-    elif act == "IT Act" and section in it_non_bailable:
-        return bail_guidelines["non_bailable"]
-    elif act == "MV Act" and section in mv_non_bailable:
-        return bail_guidelines["non_bailable"]
-    else:
-        return bail_guidelines["bailable"]
+    return _bail_records[get_bail_type(section, act)]
 
-def get_precedents_for_section(section, act="IPC"):
+def _build_offense_records():
     """
-    Get legal precedents for a specific section.
+    Build the (act, section) -> offense record table.
     """
-    relevant_precedents = []
+    general_rights = _freeze(defendant_rights["general"])
+    records = {}
+    for act, sections_dict in act_sections.items():
+        for section, title in sections_dict.items():
+            records[(act, section)] = MappingProxyType({
+                "section": section,
+                "act": act,
+                "title": title,
+                "rights": general_rights,
+                "bail_type": get_bail_type(section, act),
+                "bail_info": get_bail_information(section, act)
+            })
+    return MappingProxyType(records)
+
+# Offense details for every known section, with bail classification resolved
+offense_records = _build_offense_records()
+
+def get_offense_details(section, act="IPC"):
+    """
+    Get details about a specific offense based on section number and act.
     
-    for precedent in legal_precedents:
-        # Check if the precedent is relevant to the given section and act
-        if precedent["act"] == act and section in precedent["section"]:
-            relevant_precedents.append(precedent)
+    Returns a shared, read-only record, or None if the section is unknown.
+    """
+    return offense_records.get((act, str(section)))
+
+@functools.lru_cache(maxsize=None)
+def get_precedent_store():
+    """
+    Get the shared precedent store indexed by (act, section), built on first use.
+    """
+    from precedent_store import PrecedentStore
+    return PrecedentStore(legal_precedents)
+
+def get_precedents_for_section(section, act="IPC"):
+    """
+    Get legal precedents for a specific section.
     
-    return relevant_precedents
+    Only precedents on exactly this section match (section "30" does not
+    match a precedent on "302"). Returns a shared tuple; do not modify it.
+    """
+    return get_precedent_store().for_section(section, act)
 
 def get_jurisdiction_info():
     """
@@ -477,76 +575,38 @@ def get_jurisdiction_info():
 
 from amendment_data import get_amendment_history, get_latest_amendment, get_recent_amendments
 
-def search_legal_data(query):
+@functools.lru_cache(maxsize=None)
+def get_legal_data_index():
     """
-    Search for relevant legal information based on the query.
+    Get the search index over all sections and precedents, built on first use.
     """
-    results = {
-        "IPC": [],
-        "CrPC": [],
-        "CPC": [],
-        "Evidence Act": [],
-        "IT Act": [],
-        "MV Act": [],
-        "Precedents": [],
-        "Amendments": []
-    }
-    
-    query = query.lower()
-    
-    # Search in IPC sections
-    for section, title in ipc_sections.items():
-        if query in title.lower() or query in section.lower():
-            results["IPC"].append({
-                "section": section,
-                "title": title
-            })
-    
-    # Search in CrPC sections
-    for section, title in crpc_sections.items():
-        if query in title.lower() or query in section.lower():
-            results["CrPC"].append({
-                "section": section,
-                "title": title
-            })
-    
-    # Search in CPC sections
-    for section, title in cpc_sections.items():
-        if query in title.lower() or query in section.lower():
-            results["CPC"].append({
-                "section": section,
-                "title": title
-            })
-    
-    # Search in Evidence Act sections
-    for section, title in evidence_act_sections.items():
-        if query in title.lower() or query in section.lower():
-            results["Evidence Act"].append({
-                "section": section,
-                "title": title
-            })
-    
-    # Search in IT Act sections
-    for section, title in it_act_sections.items():
-        if query in title.lower() or query in section.lower():
-            results["IT Act"].append({
-                "section": section,
-                "title": title
-            })
-    
-    # Search in MV Act sections
-    for section, title in mv_act_sections.items():
-        if query in title.lower() or query in section.lower():
-            results["MV Act"].append({
-                "section": section,
-                "title": title
-            })
+    from legal_data_index import LegalDataIndex
+    return LegalDataIndex(act_sections, get_precedent_store())
+
+@functools.lru_cache(maxsize=None)
+def get_section_autocomplete():
+    """
+    Get the typo-tolerant section lookup over all acts, built on first use.
+    """
+    from section_autocomplete import SectionAutocomplete
+    return SectionAutocomplete(act_sections)
+
+def get_section_options(act):
+    """
+    Get the shared, read-only section picker options for an act.
     
-    # Search in precedents
-    for precedent in legal_precedents:
-        if (query in precedent["case_name"].lower() or 
-            query in precedent["summary"].lower() or 
-            any(query in point.lower() for point in precedent["key_points"])):
-            results["Precedents"].append(precedent)
+    Returns:
+        mappingproxy: {"Section <number>: <title>": number}
+    """
+    return get_section_autocomplete().section_options(act)
+
+def search_legal_data(query):
+    """
+    Search for relevant legal information based on the query.
     
+    Matches are case-insensitive substrings of section numbers, titles and
+    precedent text, ranked by relevance within each act.
+    """
+    results = get_legal_data_index().search(query)
+    results["Amendments"] = []
     return results
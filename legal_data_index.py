@@ -0,0 +1,241 @@
+"""
+In-memory search index over the statute sections and precedents in legal_data.
+
+Every searchable field is lowercased once at build time and its character
+n-grams (lengths 1 to NGRAM_SIZE) go into an inverted index. A query is
+answered by intersecting the postings of its n-grams, smallest first, and
+only the surviving candidates are checked with an exact substring test, so
+results are the same as a full scan ("498" still finds "498A", "murd" still
+finds "Murder") but cost grows with the number of matches, not the corpus.
+
+Matches are ranked: exact section numbers first, then section prefixes,
+whole title words, title word prefixes and other substrings, with body text
+(precedent summaries and key points) weighted lowest.
+
+Precedents come from a PrecedentStore; ones added to the store after the
+index was built are indexed on the next search.
+"""
+
+import re
+import threading
+
+# Longest n-gram indexed; longer queries use all of their n-grams of this size
+NGRAM_SIZE = 3
+
+# Relevance of a match by field kind and match type
+MATCH_SCORES = {
+    "section": {"exact": 100.0, "prefix": 60.0, "substring": 30.0},
+    "title": {"exact": 80.0, "word": 25.0, "prefix": 18.0, "substring": 10.0},
+    "body": {"exact": 8.0, "word": 5.0, "prefix": 4.0, "substring": 2.0}
+}
+
+_WORD_BOUNDARY = re.compile(r"\w+")
+
+
+def ngrams(text, max_size=NGRAM_SIZE):
+    """
+    Return the distinct character n-grams of text, lengths 1 to max_size.
+
+    Args:
+        text (str): Lowercased text
+        max_size (int): Longest n-gram
+
+    Returns:
+        set: N-grams
+    """
+    grams = set()
+    for size in range(1, max_size + 1):
+        grams.update(text[i:i + size] for i in range(len(text) - size + 1))
+    return grams
+
+
+def query_ngrams(query, max_size=NGRAM_SIZE):
+    """
+    Return the n-grams that every text containing query must also contain.
+
+    Args:
+        query (str): Lowercased query
+
+    Returns:
+        set: The query itself if short, else its n-grams of length max_size
+    """
+    if len(query) <= max_size:
+        return {query}
+    return {query[i:i + max_size] for i in range(len(query) - max_size + 1)}
+
+
+def _match_type(query, text, words):
+    """Classify how query occurs in text: exact, word, prefix, substring or None."""
+    if query not in text:
+        return None
+    if query == text:
+        return "exact"
+    if query in words:
+        return "word"
+    if any(word.startswith(query) for word in words):
+        return "prefix"
+    return "substring"
+
+
+class LegalDataIndex:
+    """
+    A prebuilt n-gram inverted index over statute sections and precedents.
+    """
+
+    def __init__(self, act_sections, precedent_store):
+        """
+        Build the index.
+
+        Args:
+            act_sections (dict): Act name -> {section number: title}
+            precedent_store (PrecedentStore): Precedents with case_name,
+                summary and key_points
+        """
+        self.acts = list(act_sections)
+        self.precedent_store = precedent_store
+        self._lock = threading.Lock()
+
+        # Each document: (result group, payload, ((kind, text, words), ...))
+        self.documents = []
+        for act, sections in act_sections.items():
+            for section, title in sections.items():
+                self._add(act, {"section": section, "title": title}, [
+                    ("section", section),
+                    ("title", title)
+                ])
+
+        self.store_version = precedent_store.version
+        self.precedents_indexed = 0
+        self._add_precedents(list(precedent_store.precedents))
+
+        # n-gram -> set of document ids
+        self.postings = {}
+        for doc_id, (_, _, fields) in enumerate(self.documents):
+            for gram in self._grams(fields):
+                self.postings.setdefault(gram, set()).add(doc_id)
+
+    def _add(self, group, payload, fields):
+        """Add a document, lowercasing and splitting its fields once."""
+        prepared = tuple(
+            (kind, text.lower(), frozenset(_WORD_BOUNDARY.findall(text.lower())))
+            for kind, text in fields
+        )
+        self.documents.append((group, payload, prepared))
+
+    def _add_precedents(self, precedents):
+        """Add precedent documents (without updating the postings)."""
+        for precedent in precedents:
+            self._add("Precedents", precedent, [("title", precedent["case_name"]), ("body", precedent["summary"])]
+                      + [("body", point) for point in precedent["key_points"]])
+        self.precedents_indexed += len(precedents)
+
+    @staticmethod
+    def _grams(fields):
+        """All n-grams of a document's prepared fields."""
+        grams = set()
+        for _, text, _ in fields:
+            grams.update(ngrams(text))
+        return grams
+
+    def _sync(self):
+        """Index precedents added to the store since the last search."""
+        if self.store_version == self.precedent_store.version:
+            return
+
+        with self._lock:
+            if self.store_version == self.precedent_store.version:
+                return
+            store_version = self.precedent_store.version
+            first_doc = len(self.documents)
+            self._add_precedents(self.precedent_store.precedents[self.precedents_indexed:])
+
+            # Postings are replaced, not modified, so concurrent searches
+            # never iterate a set that is changing
+            additions = {}
+            for doc_id in range(first_doc, len(self.documents)):
+                for gram in self._grams(self.documents[doc_id][2]):
+                    additions.setdefault(gram, set()).add(doc_id)
+            for gram, doc_ids in additions.items():
+                self.postings[gram] = self.postings.get(gram, set()) | doc_ids
+            self.store_version = store_version
+
+    def candidates(self, query):
+        """
+        Return ids of documents that may contain query.
+
+        Args:
+            query (str): Lowercased query
+
+        Returns:
+            set: Candidate document ids, a superset of the true matches
+        """
+        postings = []
+        for gram in query_ngrams(query):
+            posting = self.postings.get(gram)
+            if not posting:
+                return set()
+            postings.append(posting)
+
+        postings.sort(key=len)
+        result = set(postings[0])
+        for posting in postings[1:]:
+            result &= posting
+            if not result:
+                break
+        return result
+
+    def score(self, doc_id, query):
+        """
+        Score a document against a query.
+
+        Args:
+            doc_id (int): Document id
+            query (str): Lowercased query
+
+        Returns:
+            float: Relevance, 0.0 if the query occurs in no field
+        """
+        best = 0.0
+        for kind, text, words in self.documents[doc_id][2]:
+            match = _match_type(query, text, words)
+            if match is not None:
+                scores = MATCH_SCORES[kind]
+                best = max(best, scores.get(match, scores["substring"]))
+        return best
+
+    def search(self, query):
+        """
+        Search sections and precedents.
+
+        Args:
+            query (str): Search text; matched case-insensitively as a substring
+
+        Returns:
+            dict: Result group (act name or "Precedents") -> results ranked by
+                relevance, ties kept in data order
+        """
+        results = {act: [] for act in self.acts}
+        results["Precedents"] = []
+
+        query = (query or "").lower().strip()
+        if not query:
+            return results
+
+        self._sync()
+
+        scored = []
+        for doc_id in self.candidates(query):
+            relevance = self.score(doc_id, query)
+            if relevance > 0:
+                scored.append((-relevance, doc_id))
+        scored.sort()
+
+        # Results are plain copies, so callers can edit them; section payloads
+        # are the index's own and precedents are read-only store records
+        for _, doc_id in scored:
+            group, payload, _ = self.documents[doc_id]
+            if group == "Precedents":
+                results[group].append(dict(payload, key_points=list(payload["key_points"])))
+            else:
+                results[group].append(dict(payload))
+        return results
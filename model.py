@@ -1,22 +1,135 @@
-import pandas as pd
 import numpy as np
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
-from sklearn.ensemble import RandomForestClassifier
-import pickle
-import re
-import nltk
-from nltk.corpus import stopwords
-from nltk.tokenize import word_tokenize
-import os
+import copy
+from registry import LazySingleton
+from result_cache import ResultCache, normalize_query
+from text_pipeline import legal_text_pipeline
 
-# Ensure NLTK data is downloaded
-try:
-    nltk.data.find('tokenizers/punkt')
-    nltk.data.find('corpora/stopwords')
-except LookupError:
-    nltk.download('punkt')
-    nltk.download('stopwords')
+class DefenseOptionIndex:
+    """
+    Pre-tokenized defense options with an inverted term -> option index.
+    
+    Built once from the defense options table so scoring a case description
+    is a single tokenization plus one lookup pass over its terms, regardless
+    of how many sections the table covers.
+    """
+    
+    # Base relevance of common and section-specific options
+    COMMON_RELEVANCE = 0.7
+    SPECIFIC_RELEVANCE = 0.9
+    
+    def __init__(self, options_table):
+        """
+        Build the index from a defense options table.
+        
+        Args:
+            options_table (dict): {"common": [...], act: {section: [...]}}
+        """
+        self.options = []
+        option_ids = {}
+        
+        def option_id(option):
+            if option not in option_ids:
+                option_ids[option] = len(self.options)
+                self.options.append(option)
+            return option_ids[option]
+        
+        self.common = tuple((option_id(o), self.COMMON_RELEVANCE) for o in options_table["common"])
+        
+        # (act, section) -> ((option id, base relevance), ...) in display order
+        self.entries = {}
+        for act, sections in options_table.items():
+            if act == "common":
+                continue
+            for section, options in sections.items():
+                self.entries[(act, section)] = self.common + tuple(
+                    (option_id(o), self.SPECIFIC_RELEVANCE) for o in options
+                )
+        
+        # term -> ids of options containing it
+        self.postings = {}
+        for idx, option in enumerate(self.options):
+            for term in legal_text_pipeline.terms(option):
+                self.postings.setdefault(term, []).append(idx)
+    
+    def score(self, section, act, description_terms):
+        """
+        Rank the options applicable to a section by relevance to a description.
+        
+        Args:
+            section (str): Section number
+            act (str): Act name
+            description_terms (set): Preprocessed terms of the case description
+            
+        Returns:
+            list: (option, relevance) tuples sorted by relevance, highest first
+        """
+        matches = {}
+        for term in description_terms:
+            for idx in self.postings.get(term, ()):
+                matches[idx] = matches.get(idx, 0) + 1
+        
+        scored = []
+        for idx, relevance in self.entries.get((act, section), self.common):
+            if idx in matches:
+                relevance += min(0.3, matches[idx] * 0.1)  # Max boost of 0.3
+            scored.append((self.options[idx], min(1.0, relevance)))
+        
+        scored.sort(key=lambda x: x[1], reverse=True)
+        return scored
+
+class RightsRelevanceModel:
+    """
+    The defendant rights catalogue compiled into a matrix of rule flags.
+    
+    Each right gets a one-hot row for the first rule that applies to it
+    (bail, appeal, legal representation or other), so the relevance of every
+    right for a bail type is a single dot product with that type's weights.
+    """
+    
+    # Rule flags in precedence order; a right is flagged by the first match
+    RULES = ["bail", "appeal", "legal representation"]
+    
+    # Relevance weight of each rule flag (plus "other") per bail type
+    WEIGHTS = {
+        "non_bailable": np.array([0.9, 0.8, 1.0, 0.6]),
+        "bailable": np.array([0.7, 0.8, 1.0, 0.6])
+    }
+    
+    def __init__(self, rights_catalogue, groups=("general", "bail", "trial")):
+        """
+        Compile the rights catalogue.
+        
+        Args:
+            rights_catalogue (dict): Group name -> list of rights
+            groups (tuple): Groups to include, in display order
+        """
+        # Keep the first occurrence of each right
+        self.rights = list(dict.fromkeys(
+            right for group in groups for right in rights_catalogue[group]
+        ))
+        
+        self.flags = np.zeros((len(self.rights), len(self.RULES) + 1))
+        for row, right in enumerate(self.rights):
+            lowered = right.lower()
+            column = next(
+                (col for col, rule in enumerate(self.RULES) if rule in lowered),
+                len(self.RULES)
+            )
+            self.flags[row, column] = 1.0
+    
+    def rank(self, bail_type):
+        """
+        Rank all rights by relevance for a bail type.
+        
+        Args:
+            bail_type (str): "bailable" or "non_bailable"
+            
+        Returns:
+            tuple: (right, relevance) pairs sorted by relevance, highest first
+        """
+        relevance = self.flags @ self.WEIGHTS[bail_type]
+        order = np.argsort(-relevance, kind="stable")
+        return tuple((self.rights[idx], float(relevance[idx])) for idx in order)
 
 class LegalPredictor:
     """
@@ -32,16 +145,16 @@ class LegalPredictor:
         self.rights_classifier = None
         self.defense_classifier = None
         self.precedent_data = None
+        self.precedent_index = None
+        self.precedent_store = None
+        self.defense_options = None
+        self.defense_option_index = None
+        self.rights_relevance = None
+        self.rights_relevance_cache = {}
         self.legal_code_data = None
         self.sample_data_loaded = False
-        
-        # Initialize NLTK data if not already downloaded
-        try:
-            nltk.data.find('tokenizers/punkt')
-            nltk.data.find('corpora/stopwords')
-        except LookupError:
-            nltk.download('punkt')
-            nltk.download('stopwords')
+        self.precedent_version = 0
+        self.result_cache = ResultCache()
     
     def load_sample_data(self):
         """
@@ -51,7 +164,11 @@ class LegalPredictor:
         # Create sample case data
         # This is simplified for demonstration purposes
         
-        from legal_data import ipc_sections, it_act_sections, mv_act_sections, legal_precedents
+        from legal_data import (
+            ipc_sections, it_act_sections, mv_act_sections,
+            defense_options, defendant_rights, get_precedent_store
+        )
+        from search_index import PrecedentIndex
         
         self.legal_code_data = {
             "IPC": ipc_sections,
@@ -59,30 +176,33 @@ class LegalPredictor:
             "MV Act": mv_act_sections
         }
         
-        self.precedent_data = legal_precedents
+        # The store's list, so precedents added to the store are included
+        self.precedent_store = get_precedent_store()
+        self.precedent_data = self.precedent_store.precedents
+        self.precedent_index = PrecedentIndex(self.precedent_store)
+        # Indexed on first use: tokenizing the options needs the stopword list
+        self.defense_options = defense_options
+        self.defense_option_index = None
+        self.rights_relevance = RightsRelevanceModel(defendant_rights)
+        self.rights_relevance_cache = {}
+        self.precedent_version += 1
         
         self.sample_data_loaded = True
     
+    def _defense_index(self):
+        """Defense option index, built on the first defense suggestion."""
+        if self.defense_option_index is None:
+            self.defense_option_index = DefenseOptionIndex(self.defense_options)
+        return self.defense_option_index
+    
     def preprocess_text(self, text):
         """
         Preprocess text for NLP tasks.
-        """
-        # Convert to lowercase
-        text = text.lower()
-        
-        # Remove special characters and numbers
-        text = re.sub(r'[^\w\s]', '', text)
-        text = re.sub(r'\d+', '', text)
-        
-        # Tokenize
-        tokens = word_tokenize(text)
         
-        # Remove stopwords
-        stop_words = set(stopwords.words('english'))
-        filtered_tokens = [word for word in tokens if word not in stop_words]
-        
-        # Join tokens back into string
-        return ' '.join(filtered_tokens)
+        Uses the shared text pipeline, which memoizes results per input, so
+        repeated calls with the same description are cheap.
+        """
+        return legal_text_pipeline.preprocess(text)
     
     def predict_rights(self, section, act, case_description):
         """
@@ -96,50 +216,25 @@ class LegalPredictor:
         
         from legal_data import defendant_rights, get_offense_details
         
-        # Get basic rights for all cases
-        basic_rights = defendant_rights["general"]
-        
         # Get offense details
         offense_details = get_offense_details(section, act)
         
         if offense_details:
-            # Add bail information
-            bail_info = offense_details.get("bail_info", {})
-            bail_type = "non_bailable" if "non_bailable" in str(bail_info) else "bailable"
-            
-            # Get additional rights based on bail type
-            bail_rights = defendant_rights["bail"]
-            
-            # Get trial rights
-            trial_rights = defendant_rights["trial"]
-            
-            # Combine all rights
-            all_rights = basic_rights + bail_rights + trial_rights
-            
-            # Calculate relevance score (simple heuristic for demo)
-            relevance_scores = {}
-            for right in all_rights:
-                # Simple relevance calculation
-                # In a real system, this would use ML model predictions
-                if "bail" in right.lower() and bail_type == "non_bailable":
-                    relevance_scores[right] = 0.9
-                elif "bail" in right.lower() and bail_type == "bailable":
-                    relevance_scores[right] = 0.7
-                elif "appeal" in right.lower():
-                    relevance_scores[right] = 0.8
-                elif "legal representation" in right.lower():
-                    relevance_scores[right] = 1.0
-                else:
-                    relevance_scores[right] = 0.6
-            
-            # Sort by relevance
-            sorted_rights = sorted(relevance_scores.items(), key=lambda x: x[1], reverse=True)
+            # Relevance depends only on the offense, so it is cached per (act, section)
+            key = (act, str(section))
+            ranked_rights = self.rights_relevance_cache.get(key)
+            if ranked_rights is None:
+                ranked_rights = self.rights_relevance.rank(offense_details["bail_type"])
+                self.rights_relevance_cache[key] = ranked_rights
             
             return {
-                "rights": [{"right": r[0], "relevance": r[1]} for r in sorted_rights],
+                "rights": [{"right": right, "relevance": relevance} for right, relevance in ranked_rights],
                 "section_info": offense_details
             }
         
+        # Get basic rights for all cases
+        basic_rights = defendant_rights["general"]
+        
         return {
             "rights": [{"right": r, "relevance": 0.5} for r in basic_rights],
             "section_info": None
@@ -154,104 +249,9 @@ class LegalPredictor:
         
         # For demonstration, use rule-based approach
         
-        # Common defense options across various cases
-        common_options = [
-            "Challenge the admissibility of evidence",
-            "Question witness credibility",
-            "Establish alibi",
-            "Claim lack of intent (mens rea)",
-            "Procedural violations in investigation"
-        ]
-        
-        # Specific defenses based on acts and sections
-        specific_options = []
-        
-        if act == "IPC":
-            if section == "302":  # Murder
-                specific_options = [
-                    "Self-defense",
-                    "Accident or misfortune without criminal intention",
-                    "Sudden and grave provocation",
-                    "Mental disability or insanity",
-                    "Challenge cause of death"
-                ]
-            elif section == "376":  # Rape
-                specific_options = [
-                    "Consent defense",
-                    "Challenge identification",
-                    "Medical evidence inconsistencies",
-                    "Alibi defense",
-                    "Delay in filing FIR"
-                ]
-            elif section == "420":  # Cheating
-                specific_options = [
-                    "No fraudulent or dishonest intention",
-                    "Civil dispute, not criminal matter",
-                    "Legitimate business transaction",
-                    "No inducement to deliver property",
-                    "Lack of deception"
-                ]
-        elif act == "IT Act":
-            if section == "66":  # Computer-related offenses
-                specific_options = [
-                    "Authorized access",
-                    "Legitimate security testing",
-                    "No damage or harm caused",
-                    "Challenge technical evidence",
-                    "Challenge chain of custody for electronic evidence"
-                ]
-            elif section == "67":  # Obscene material
-                specific_options = [
-                    "Content not obscene by legal standards",
-                    "Freedom of expression defense",
-                    "No intent to publish/transmit",
-                    "Account was hacked",
-                    "Educational or scientific purpose"
-                ]
-        elif act == "MV Act":
-            if section == "184":  # Dangerous driving
-                specific_options = [
-                    "Challenge speed measurement accuracy",
-                    "Road conditions defense",
-                    "Medical emergency",
-                    "Vehicle mechanical failure",
-                    "Necessary evasive action"
-                ]
-            elif section == "185":  # Drunk driving
-                specific_options = [
-                    "Challenge breathalyzer calibration",
-                    "Improper testing procedure",
-                    "Medical condition affecting test",
-                    "Consumption after driving (hip flask defense)",
-                    "Necessity in emergency"
-                ]
-        
-        # Combine options and calculate relevance scores
-        all_options = common_options + specific_options
-        
-        # Calculate relevance (simplified for demo)
-        relevance_scores = {}
-        for option in all_options:
-            # Specific options are more relevant
-            if option in specific_options:
-                relevance_scores[option] = 0.9
-            else:
-                relevance_scores[option] = 0.7
-                
-            # Boost score if terms from the option appear in the case description
-            option_terms = set(self.preprocess_text(option).split())
-            description_terms = set(self.preprocess_text(case_description).split())
-            common_terms = option_terms.intersection(description_terms)
-            
-            if common_terms:
-                boost = min(0.3, len(common_terms) * 0.1)  # Max boost of 0.3
-                relevance_scores[option] += boost
-                
-            # Cap at 1.0
-            relevance_scores[option] = min(1.0, relevance_scores[option])
-        
-        # Sort by relevance
-        sorted_options = sorted(relevance_scores.items(), key=lambda x: x[1], reverse=True)
+        # Score every applicable option in one pass over the description terms
+        description_terms = legal_text_pipeline.terms(case_description)
+        sorted_options = self._defense_index().score(section, act, description_terms)
         
         return {
             "defense_options": [{"option": o[0], "relevance": o[1]} for o in sorted_options]
@@ -264,47 +264,58 @@ class LegalPredictor:
         if not self.sample_data_loaded or not self.precedent_data:
             return {"error": "Precedent data not loaded"}
         
-        # Filter precedents by section and act if provided
-        filtered_precedents = self.precedent_data
-        if section and act:
-            filtered_precedents = [p for p in self.precedent_data 
-                                 if p["act"] == act and section in p["section"]]
-        
-        if not filtered_precedents:
-            return {"precedents": []}
-        
-        # Create document corpus from precedent summaries
-        corpus = [p["summary"] for p in filtered_precedents]
-        corpus.append(case_description)  # Add the query case at the end
+        # The store version changes whenever precedents are added, so cached
+        # rankings never outlive the data they were computed from
+        cache_key = (
+            normalize_query(case_description), section, act, top_k,
+            self.precedent_version, self.precedent_store.version
+        )
+        cached = self.result_cache.get(cache_key)
+        if cached is None:
+            cached = self._find_similar_precedents(case_description, section, act, top_k)
+            self.result_cache.put(cache_key, cached)
         
-        # Vectorize
+        # Callers may modify the result, so never hand out the cached object
+        return copy.deepcopy(cached)
+    
+    def _find_similar_precedents(self, case_description, section, act, top_k):
+        """
+        Rank precedents for find_similar_precedents without caching.
+        """
         try:
-            tfidf_matrix = self.tfidf_vectorizer.fit_transform(corpus)
-            
-            # Calculate similarity between query case and all precedents
-            query_idx = len(corpus) - 1
-            similarities = cosine_similarity(tfidf_matrix[query_idx], tfidf_matrix[:-1])[0]
-            
-            # Get top-k most similar precedents
-            top_indices = similarities.argsort()[-top_k:][::-1]
-            
-            similar_precedents = []
-            for idx in top_indices:
-                precedent = filtered_precedents[idx]
-                similar_precedents.append({
-                    "case_name": precedent["case_name"],
-                    "citation": precedent["citation"],
-                    "similarity": float(similarities[idx]),
-                    "summary": precedent["summary"],
-                    "key_points": precedent["key_points"]
-                })
-            
-            return {"precedents": similar_precedents}
+            ranked = self.precedent_index.search(case_description, section, act, top_k)
         except Exception as e:
             # Fallback if vectorization fails
-            return {"precedents": filtered_precedents[:min(top_k, len(filtered_precedents))], 
+            filtered_precedents = self.precedent_data
+            if section and act:
+                filtered_precedents = self.precedent_store.for_section(section, act)
+            # Store records are read-only, so return plain copies
+            return {"precedents": [dict(p, key_points=list(p["key_points"])) for p in filtered_precedents[:min(top_k, len(filtered_precedents))]], 
                     "note": "Similarity calculation failed, showing relevant precedents without ranking"}
+        
+        similar_precedents = []
+        for precedent, similarity in ranked:
+            similar_precedents.append({
+                "case_name": precedent["case_name"],
+                "citation": precedent["citation"],
+                "similarity": similarity,
+                "summary": precedent["summary"],
+                "key_points": list(precedent["key_points"])
+            })
+        
+        return {"precedents": similar_precedents}
+
+    def cache_stats(self):
+        """
+        Report hit/miss statistics of the precedent search cache.
+        """
+        return self.result_cache.stats()
+
+def _build_legal_predictor():
+    """Create the shared legal predictor with its sample data loaded."""
+    predictor = LegalPredictor()
+    predictor.load_sample_data()
+    return predictor
 
-# Initialize the legal predictor
-legal_predictor = LegalPredictor()
-legal_predictor.load_sample_data()
+# The legal predictor is built on first use (or by registry.prewarm)
+legal_predictor = LazySingleton("legal_predictor", _build_legal_predictor)
@@ -0,0 +1,149 @@
+"""
+Lazy, centralized loading of NLTK data.
+
+Nothing is looked up or downloaded at import time. Each resource is resolved
+the first time something needs it, at most once per process, and the time it
+took is recorded for ``resource_report``.
+
+Set NLTK_OFFLINE=1 to never download: resources are then only read from the
+vendored data directory (NLTK_VENDOR_DIR, default ./nltk_data) and a missing
+resource raises LookupError immediately instead of stalling on the network.
+"""
+
+import os
+import threading
+import time
+
+# Vendored NLTK data shipped alongside the app
+VENDOR_DIR = os.environ.get(
+    "NLTK_VENDOR_DIR", os.path.join(os.path.dirname(os.path.abspath(__file__)), "nltk_data")
+)
+
+# When set, never download and only read the vendored data directory
+OFFLINE = os.environ.get("NLTK_OFFLINE", "").lower() in ("1", "true", "yes")
+
+# Resource name -> path passed to nltk.data.find
+RESOURCE_PATHS = {
+    "punkt": "tokenizers/punkt",
+    "punkt_tab": "tokenizers/punkt_tab",
+    "stopwords": "corpora/stopwords"
+}
+
+_lock = threading.Lock()
+_resolved = set()
+_failed = {}
+_stopwords = {}
+load_times = {}
+
+
+def _nltk():
+    """Import nltk on first use; importing it costs a noticeable part of a cold start."""
+    import nltk
+    return nltk
+
+
+def tokenizer_resource():
+    """Name of the punkt models used by the installed NLTK version."""
+    # NLTK 3.9 replaced the pickled punkt models with punkt_tab
+    version = tuple(int(part) for part in _nltk().__version__.split(".")[:2] if part.isdigit())
+    return "punkt_tab" if version >= (3, 9) else "punkt"
+
+
+def _configure_paths():
+    """Make the vendored directory the first (or, offline, only) search path."""
+    nltk = _nltk()
+    if OFFLINE:
+        nltk.data.path[:] = [VENDOR_DIR]
+    elif VENDOR_DIR not in nltk.data.path:
+        nltk.data.path.insert(0, VENDOR_DIR)
+
+
+def ensure_resource(name):
+    """
+    Make sure an NLTK resource is available, downloading it if allowed.
+
+    A resource that could not be found or downloaded is remembered, so later
+    calls fail immediately instead of retrying the network.
+
+    Args:
+        name (str): Resource name, e.g. "stopwords" or "punkt_tab"
+
+    Raises:
+        LookupError: If the resource is missing and cannot be downloaded
+            (always the case in offline mode)
+    """
+    if name in _resolved:
+        return
+
+    with _lock:
+        if name in _resolved:
+            return
+        if name in _failed:
+            raise LookupError(_failed[name])
+
+        start = time.perf_counter()
+        nltk = _nltk()
+        _configure_paths()
+        path = RESOURCE_PATHS.get(name, name)
+        try:
+            try:
+                nltk.data.find(path)
+            except LookupError:
+                if OFFLINE:
+                    raise LookupError(
+                        f"NLTK resource '{name}' not found in {VENDOR_DIR} (offline mode, not downloading)"
+                    )
+                try:
+                    os.makedirs(VENDOR_DIR, exist_ok=True)
+                    nltk.download(name, download_dir=VENDOR_DIR, quiet=True, raise_on_error=True)
+                    nltk.data.find(path)
+                except Exception as e:
+                    raise LookupError(f"NLTK resource '{name}' could not be downloaded: {e}")
+        except LookupError as e:
+            _failed[name] = str(e)
+            raise
+        finally:
+            load_times[name] = time.perf_counter() - start
+
+        _resolved.add(name)
+
+
+def stopwords(language="english"):
+    """
+    Return the NLTK stopword list for a language, loading it on first use.
+
+    Args:
+        language (str): Stopword list name
+
+    Returns:
+        frozenset: Stopwords
+    """
+    if language not in _stopwords:
+        ensure_resource("stopwords")
+        start = time.perf_counter()
+        from nltk.corpus import stopwords as stopwords_corpus
+        _stopwords[language] = frozenset(stopwords_corpus.words(language))
+        load_times[f"stopwords:{language}"] = time.perf_counter() - start
+    return _stopwords[language]
+
+
+def word_tokenize(text):
+    """NLTK word tokenization, loading the tokenizer models on first use."""
+    ensure_resource(tokenizer_resource())
+    return _nltk().word_tokenize(text)
+
+
+def sent_tokenize(text):
+    """NLTK sentence tokenization, loading the tokenizer models on first use."""
+    ensure_resource(tokenizer_resource())
+    return _nltk().sent_tokenize(text)
+
+
+def resource_report():
+    """
+    Report which resources have been loaded and how long each took.
+
+    Returns:
+        dict: Resource name -> load time in milliseconds
+    """
+    return {name: seconds * 1000 for name, seconds in load_times.items()}
@@ -2,7 +2,7 @@ import streamlit as st
 import pandas as pd
 import numpy as np
 import plotly.express as px
-import os
+from judgments_store import JUDGMENTS_CSV, judgments_available, get_judgments
 
 st.set_page_config(
     page_title="🧾 Advocate Tracker Module",
@@ -16,25 +16,18 @@ Track the most frequent appearing advocates (petitioner and respondent) and visu
 """)
 
 # --- Load Judgments CSV ---
-JUDGMENTS_CSV = os.path.join("assets", "judgments.csv")
-if not os.path.exists(JUDGMENTS_CSV):
-    st.error("Judgments CSV not found at 'assets/judgments.csv'. Please upload the file.")
+if not judgments_available():
+    st.error(f"Judgments CSV not found at '{JUDGMENTS_CSV}'. Please upload the file.")
     st.stop()
 
-@st.cache_data(show_spinner=False)
-def load_judgments():
-    df = pd.read_csv(JUDGMENTS_CSV)
-    df.columns = [c.strip().lower() for c in df.columns]
-    return df
-
-judgments = load_judgments()
+judgments = get_judgments()
 
 # --- Filter by Case Type ---
-case_types = ['All'] + sorted(judgments['judgement_type'].dropna().unique())
+case_types = ['All'] + sorted(judgments['Judgement_type'].dropna().unique())
 selected_case_type = st.selectbox("📋 Filter by Case Type", case_types)
 
 if selected_case_type != 'All':
-    filtered = judgments[judgments['judgement_type'] == selected_case_type].copy()
+    filtered = judgments[judgments['Judgement_type'] == selected_case_type].copy()
 else:
     filtered = judgments.copy()
 
@@ -3,7 +3,7 @@ import pandas as pd
 from argument_generator import argument_generator
 from legal_data import (
     get_offense_details, get_bail_information, bail_guidelines,
-    ipc_sections, it_act_sections, mv_act_sections
+    get_section_options
 )
 
 st.set_page_config(
@@ -787,12 +787,7 @@ with tab1:
     act_code = act_options[selected_act]
             
     # Show relevant sections based on selected act
-    if act_code == "IPC":
-        section_options = {f"Section {k}: {v}": k for k, v in ipc_sections.items()}
-    elif act_code == "IT Act":
-        section_options = {f"Section {k}: {v}": k for k, v in it_act_sections.items()}
-    else:  # MV Act
-        section_options = {f"Section {k}: {v}": k for k, v in mv_act_sections.items()}
+    section_options = get_section_options(act_code)
     
     selected_section_display = st.selectbox("Select Section", options=list(section_options.keys()))
     selected_section = section_options[selected_section_display]
@@ -820,7 +815,7 @@ with tab1:
                 bail_info = offense_details.get("bail_info", {})
                 
                 # Determine if bailable
-                is_bailable = "bailable" in str(bail_info).lower()
+                is_bailable = offense_details["bail_type"] == "bailable"
                 
                 # Display eligibility information
                 st.markdown(f"### Bail Eligibility for {act_code} Section {selected_section}")
@@ -927,12 +922,7 @@ with tab2:
         arg_act_code = arg_act_options[arg_selected_act]
         
         # Show relevant sections based on selected act
-        if arg_act_code == "IPC":
-            arg_section_options = {f"Section {k}: {v}": k for k, v in ipc_sections.items()}
-        elif arg_act_code == "IT Act":
-            arg_section_options = {f"Section {k}: {v}": k for k, v in it_act_sections.items()}
-        else:  # MV Act
-            arg_section_options = {f"Section {k}: {v}": k for k, v in mv_act_sections.items()}
+        arg_section_options = get_section_options(arg_act_code)
         
         arg_selected_section_display = st.selectbox("Select Section", options=list(arg_section_options.keys()), key="arg_section")
         arg_selected_section = arg_section_options[arg_selected_section_display]
@@ -1,5 +1,6 @@
 import streamlit as st
 import pandas as pd
+from judgments_store import get_judgments
 
 st.set_page_config(page_title="Case Metadata Viewer", page_icon="📑", layout="wide")
 st.title("📑 Case Metadata Viewer")
@@ -7,13 +8,7 @@ st.markdown("""
 This public record viewer displays case metadata from the judgments database. Use the search box to filter cases. Click the PDF link to view the full judgment.
 """)
 
-@st.cache_data
-def load_data():
-    df = pd.read_csv('assets/judgments.csv')
-    df['judgment_dates'] = pd.to_datetime(df['judgment_dates'], format='%d-%m-%Y', errors='coerce')
-    return df
-
-df = load_data()
+df = get_judgments()
 
 # Select columns to display
 columns = {
@@ -2,8 +2,8 @@ import streamlit as st
 import pandas as pd
 from model import legal_predictor
 from legal_data import (
-    ipc_sections, it_act_sections, mv_act_sections,
-    get_offense_details, get_bail_information
+    get_section_options,
+    get_offense_details, get_bail_information, get_bail_type
 )
 
 st.set_page_config(
@@ -128,12 +128,7 @@ with tab1:
     act_code = act_options[selected_act]
     
     # Show relevant sections based on selected act
-    if act_code == "IPC":
-        section_options = {f"Section {k}: {v}": k for k, v in ipc_sections.items()}
-    elif act_code == "IT Act":
-        section_options = {f"Section {k}: {v}": k for k, v in it_act_sections.items()}
-    else:  # MV Act
-        section_options = {f"Section {k}: {v}": k for k, v in mv_act_sections.items()}
+    section_options = get_section_options(act_code)
     
     selected_section_display = st.selectbox("Select Section", options=list(section_options.keys()))
     selected_section = section_options[selected_section_display]
@@ -257,12 +252,7 @@ with tab2:
     bail_act_code = bail_act_options[bail_selected_act]
     
     # Show relevant sections based on selected act
-    if bail_act_code == "IPC":
-        bail_section_options = {f"Section {k}: {v}": k for k, v in ipc_sections.items()}
-    elif bail_act_code == "IT Act":
-        bail_section_options = {f"Section {k}: {v}": k for k, v in it_act_sections.items()}
-    else:  # MV Act
-        bail_section_options = {f"Section {k}: {v}": k for k, v in mv_act_sections.items()}
+    bail_section_options = get_section_options(bail_act_code)
     
     bail_selected_section_display = st.selectbox("Select Section", options=list(bail_section_options.keys()), key="bail_section")
     bail_selected_section = bail_section_options[bail_selected_section_display]
@@ -271,12 +261,13 @@ with tab2:
         with st.spinner("Fetching bail information..."):
             # Get bail information
             bail_info = get_bail_information(bail_selected_section, bail_act_code)
+            bail_type = get_bail_type(bail_selected_section, bail_act_code)
             
             if not bail_info:
                 st.error("Could not retrieve bail information for the selected section.")
             else:
                 # Display bail category
-                if "bailable" in str(bail_info).lower():
+                if bail_type == "bailable":
                     st.success("### Bailable Offense")
                     st.markdown("""
                     This is a **bailable offense**, which means bail is a matter of right. 
@@ -304,7 +295,7 @@ with tab2:
                         st.markdown(f"- {example}")
                 
                 # Special provisions
-                if "non_bailable" in str(bail_info).lower():
+                if bail_type == "non_bailable":
                     st.markdown("### Special Considerations for Bail")
                     st.markdown("""
                     Even for non-bailable offenses, bail may be granted under special circumstances:
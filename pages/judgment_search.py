@@ -1,6 +1,10 @@
 import streamlit as st
 import pandas as pd
+import numpy as np
 from datetime import datetime
+from judgments_store import get_judgments, data_version
+from judgment_filters import get_filter_engine
+from judgment_analytics import multilingual_judges
 
 st.set_page_config(
     page_title="Judgment Search - Indian Legal Assistant",
@@ -11,16 +15,23 @@ st.set_page_config(
 st.title("🔍 Judgment Search")
 st.markdown("### Search and filter through legal judgments")
 
-# Load the judgments data
-@st.cache_data
-def load_judgments_data():
-    df = pd.read_csv('assets/judgments.csv')
-    # Convert judgment_dates to datetime
-    df['judgment_dates'] = pd.to_datetime(df['judgment_dates'], format='%d-%m-%Y', errors='coerce')
-    return df
+# Result page sizes offered to the user
+PAGE_SIZE_OPTIONS = [10, 25, 50, 100]
 
-# Load data
-df = load_judgments_data()
+# Sort options: (column, ascending); None keeps data order
+SORT_ORDERS = {
+    "Data order": (None, True),
+    "Newest first": ("judgment_dates", False),
+    "Oldest first": ("judgment_dates", True),
+    "Case number": ("case_no", True)
+}
+
+# Columns shown in the results table
+RESULT_COLUMNS = ['case_no', 'pet', 'res', 'Judgement_type', 'judgment_dates',
+                  'language', 'bench', 'judgement_by', 'temp_link']
+
+# Load data (shared by all pages; do not modify in place)
+df = get_judgments()
 
 # Create search form
 with st.form("search_form"):
@@ -56,78 +67,84 @@ with st.form("search_form"):
     submitted = st.form_submit_button("🔍 Search", use_container_width=True)
 
 if submitted:
-    # Filter data based on search criteria
-    filtered_df = df.copy()
-    # Apply judge/bench filter
-    if judge_search:
-        filtered_df = filtered_df[
-            filtered_df['bench'].str.contains(judge_search, case=False, na=False) |
-            filtered_df['judgement_by'].str.contains(judge_search, case=False, na=False)
-        ]
-    # Apply judgment type filter
-    if selected_type != 'All':
-        filtered_df = filtered_df[filtered_df['Judgement_type'] == selected_type]
-    # Apply language filter
-    if selected_language != 'All':
-        filtered_df = filtered_df[filtered_df['language'] == selected_language]
-    # Apply multi-party search
-    if party_search:
-        parties = [p.strip() for p in party_search.split(',') if p.strip()]
-        if parties:
-            party_mask = False
-            for p in parties:
-                party_mask = party_mask | filtered_df['pet'].str.contains(p, case=False, na=False) | filtered_df['res'].str.contains(p, case=False, na=False)
-            filtered_df = filtered_df[party_mask]
+    # Filter data based on search criteria using the prebuilt indexes
+    parties = [p.strip() for p in party_search.split(',') if p.strip()] if party_search else []
+    adv, bench = None, None
     # Advocate + Bench combo search
     if adv_bench_search:
         adv_bench_parts = [x.strip() for x in adv_bench_search.split(',') if x.strip()]
         if len(adv_bench_parts) == 2:
             adv, bench = adv_bench_parts
-            adv_mask = filtered_df['pet_adv'].str.contains(adv, case=False, na=False) | filtered_df['res_adv'].str.contains(adv, case=False, na=False)
-            bench_mask = filtered_df['bench'].str.contains(bench, case=False, na=False)
-            filtered_df = filtered_df[adv_mask & bench_mask]
         elif len(adv_bench_parts) == 1:
             adv = adv_bench_parts[0]
-            adv_mask = filtered_df['pet_adv'].str.contains(adv, case=False, na=False) | filtered_df['res_adv'].str.contains(adv, case=False, na=False)
-            filtered_df = filtered_df[adv_mask]
-    # Apply date range filter
-    start_date = pd.to_datetime(date_range[0])
-    end_date = pd.to_datetime(date_range[1])
-    filtered_df = filtered_df[
-        (filtered_df['judgment_dates'] >= start_date) &
-        (filtered_df['judgment_dates'] <= end_date)
-    ]
+    matching_rows = get_filter_engine().search(
+        judge=judge_search or None,
+        judgment_type=selected_type if selected_type != 'All' else None,
+        language=selected_language if selected_language != 'All' else None,
+        parties=parties,
+        advocate=adv,
+        bench=bench,
+        start_date=pd.to_datetime(date_range[0]),
+        end_date=pd.to_datetime(date_range[1])
+    )
+    # Keep the matches across reruns so paging does not need a new search
+    st.session_state['judgment_search_rows'] = matching_rows
+    st.session_state['judgment_search_version'] = data_version()
+    st.session_state['judgment_search_page'] = 1
+
+# Row positions are only valid for the data they were computed on
+matching_rows = None
+if st.session_state.get('judgment_search_version') == data_version():
+    matching_rows = st.session_state.get('judgment_search_rows')
+
+if matching_rows is not None:
     # Display results
-    st.markdown(f"### Found {len(filtered_df)} matching judgments")
-    # Display results in an expandable format
-    for _, row in filtered_df.iterrows():
-        with st.expander(f"{row['case_no']} - {row['pet']} vs {row['res']}"):
-            col1, col2 = st.columns(2)
-            with col1:
-                st.markdown(f"**Case Number:** {row['case_no']}")
-                st.markdown(f"**Judgment Type:** {row['Judgement_type']}")
-                st.markdown(f"**Judgment Date:** {row['judgment_dates'].strftime('%d-%m-%Y')}")
-                st.markdown(f"**Language:** {row['language'] if pd.notna(row['language']) else 'Not specified'}")
-            with col2:
-                st.markdown(f"**Bench:** {row['bench']}")
-                st.markdown(f"**Judgment By:** {row['judgement_by']}")
-                st.markdown(f"**Petitioner:** {row['pet']}")
-                st.markdown(f"**Respondent:** {row['res']}")
-            # Add link to judgment if available
-            if pd.notna(row['temp_link']):
-                st.markdown(f"[View Judgment PDF]({row['temp_link']})")
+    total = len(matching_rows)
+    st.markdown(f"### Found {total} matching judgments")
+    
+    sort_col, size_col = st.columns(2)
+    with sort_col:
+        sort_order = st.selectbox("Sort by", list(SORT_ORDERS.keys()), key="judgment_search_sort")
+    with size_col:
+        page_size = st.selectbox("Results per page", PAGE_SIZE_OPTIONS, index=1, key="judgment_search_page_size")
+    
+    # Stable sort of the matching row positions on one column; ties keep data
+    # order and missing values go last, so pages never overlap or skip rows
+    column, ascending = SORT_ORDERS[sort_order]
+    if column is not None:
+        ranks = df[column].iloc[matching_rows].rank(method='dense', na_option='bottom' if ascending else 'top').to_numpy()
+        matching_rows = matching_rows[np.argsort(ranks if ascending else -ranks, kind='stable')]
+    
+    page_count = max(1, -(-total // page_size))
+    if st.session_state.get('judgment_search_page', 1) > page_count:
+        st.session_state['judgment_search_page'] = page_count
+    page = st.number_input("Page", min_value=1, max_value=page_count, step=1, key="judgment_search_page")
+    start = (page - 1) * page_size
+    page_rows = matching_rows[start:start + page_size]
+    st.caption(f"Showing {start + 1 if total else 0}-{start + len(page_rows)} of {total} (page {page} of {page_count})")
+    
+    # One table per page instead of an expander per judgment
+    st.dataframe(
+        df.iloc[page_rows][RESULT_COLUMNS],
+        column_config={
+            'case_no': 'Case Number',
+            'pet': 'Petitioner',
+            'res': 'Respondent',
+            'Judgement_type': 'Judgment Type',
+            'judgment_dates': st.column_config.DateColumn('Judgment Date', format='DD-MM-YYYY'),
+            'language': 'Language',
+            'bench': 'Bench',
+            'judgement_by': 'Judgment By',
+            'temp_link': st.column_config.LinkColumn('Judgment PDF', display_text='View PDF')
+        },
+        hide_index=True,
+        use_container_width=True
+    )
     # Judge Language Bias Analysis Section
     st.markdown("---")
     st.markdown("## 🧑‍⚖️ Judge Language Bias Analysis")
-    judge_lang_stats = df.groupby(['judgement_by', 'language']).size().reset_index(name='count')
-    judge_totals = df['judgement_by'].value_counts().to_dict()
-    judge_bias = []
-    for judge in judge_lang_stats['judgement_by'].unique():
-        judge_data = judge_lang_stats[judge_lang_stats['judgement_by'] == judge]
-        total = judge_totals.get(judge, 1)
-        lang_dist = {row['language']: row['count']/total for _, row in judge_data.iterrows()}
-        if len(lang_dist) > 1:
-            judge_bias.append({'Judge': judge, 'Language Distribution': lang_dist})
+    # Independent of the search, so computed once per data version
+    judge_bias = multilingual_judges()
     if judge_bias:
         st.markdown("### Judges with Multiple Language Judgments")
         for jb in judge_bias:
@@ -3,7 +3,7 @@ import pandas as pd
 from argument_generator import argument_generator
 from model import legal_predictor
 from legal_data import (
-    ipc_sections, it_act_sections, mv_act_sections,
+    get_section_options,
     get_offense_details, get_precedents_for_section, get_jurisdiction_info
 )
 
@@ -52,12 +52,7 @@ with tab1:
         act_code = act_options[selected_act]
         
         # Show relevant sections based on selected act
-        if act_code == "IPC":
-            section_options = {f"Section {k}: {v}": k for k, v in ipc_sections.items()}
-        elif act_code == "IT Act":
-            section_options = {f"Section {k}: {v}": k for k, v in it_act_sections.items()}
-        else:  # MV Act
-            section_options = {f"Section {k}: {v}": k for k, v in mv_act_sections.items()}
+        section_options = get_section_options(act_code)
         
         selected_section_display = st.selectbox("Select Section", options=list(section_options.keys()))
         selected_section = section_options[selected_section_display]
@@ -3,7 +3,7 @@ import pandas as pd
 from legal_data import (
     ipc_sections, it_act_sections, mv_act_sections,
     crpc_sections, cpc_sections, evidence_act_sections,
-    get_offense_details, search_legal_data
+    get_offense_details, search_legal_data, get_section_autocomplete
 )
 
 st.set_page_config(
@@ -130,7 +130,14 @@ if search_query:
                         st.markdown(f"- **Section {result['section']}**: {result['title']}")
         
         if not has_results:
-            st.info("No matching results found. Try different keywords or check the full codes below.")
+            # Fall back to typo-tolerant section lookup, e.g. "cheatng" -> IPC 420
+            suggestions = get_section_autocomplete().lookup(search_query, limit=5)
+            if suggestions:
+                st.markdown("### Did you mean")
+                for suggestion in suggestions:
+                    st.markdown(f"- **{suggestion['act']} Section {suggestion['section']}**: {suggestion['title']}")
+            else:
+                st.info("No matching results found. Try different keywords or check the full codes below.")
 
 # Code type selector
 code_type = st.selectbox(
@@ -186,8 +193,7 @@ if code_type == "Criminal Laws":
                         
                         if 'bail_info' in section_details:
                             st.markdown("**Bail Information:**")
-                            bail_info = section_details['bail_info']
-                            if "bailable" in str(bail_info).lower():
+                            if section_details['bail_type'] == "bailable":
                                 st.success("This is a **bailable** offense.")
                             else:
                                 st.error("This is a **non-bailable** offense.")
@@ -209,7 +215,7 @@ if code_type == "Criminal Laws":
                 
                 st.markdown("**Bail Information:**")
                 bail_info = section_details.get("bail_info", {})
-                if "bailable" in str(bail_info).lower():
+                if section_details["bail_type"] == "bailable":
                     st.success("This is a **bailable** offense.")
                 else:
                     st.error("This is a **non-bailable** offense.")
@@ -263,8 +269,7 @@ if code_type == "Criminal Laws":
                     st.markdown(f"- {right}")
                 
                 st.markdown("**Bail Information:**")
-                bail_info = section_details.get("bail_info", {})
-                if "bailable" in str(bail_info).lower():
+                if section_details["bail_type"] == "bailable":
                     st.success("This is a **bailable** offense.")
                 else:
                     st.error("This is a **non-bailable** offense.")
@@ -429,8 +434,7 @@ elif code_type == "Special Laws":
                 st.markdown(f"- {right}")
             
             st.markdown("**Bail Information:**")
-            bail_info = section_details.get("bail_info", {})
-            if "bailable" in str(bail_info).lower():
+            if section_details["bail_type"] == "bailable":
                 st.success("This is a **bailable** offense.")
             else:
                 st.error("This is a **non-bailable** offense.")
@@ -6,6 +6,7 @@ from sklearn.ensemble import RandomForestClassifier, RandomForestRegressor
 from sklearn.preprocessing import LabelEncoder
 from datetime import timedelta
 import plotly.express as px
+from judgments_store import get_judgments
 st.set_page_config(page_title="Predictive Module (ML-based)", page_icon="📈", layout="wide")
 st.title("📈 Predictive Module (ML-based)")
 st.markdown("""
@@ -17,14 +18,8 @@ This module predicts:
 *Powered by simple ML models trained on your judgments CSV.*
 """)
 
-# Load data
-def load_data():
-    df = pd.read_csv('assets/judgments.csv')
-    # Convert judgment_dates to datetime
-    df['judgment_dates'] = pd.to_datetime(df['judgment_dates'], format='%d-%m-%Y', errors='coerce')
-    return df
-
-df = load_data()
+# Load data (shared by all pages; do not modify in place)
+df = get_judgments()
 
 # Feature engineering
 def prepare_features(df):
@@ -32,8 +27,9 @@ def prepare_features(df):
     # Fill missing values
     data['pet'] = data['pet'].fillna('Unknown')
     data['res'] = data['res'].fillna('Unknown')
-    data['judgement_by'] = data['judgement_by'].fillna('Unknown')
-    data['Judgement_type'] = data['Judgement_type'].fillna('Other')
+    # Categorical columns only accept known categories, so fill as plain strings
+    data['judgement_by'] = data['judgement_by'].astype(object).fillna('Unknown')
+    data['Judgement_type'] = data['Judgement_type'].astype(object).fillna('Other')
     # Encode parties (petitioner/respondent) as categorical features
     le_pet = LabelEncoder()
     le_res = LabelEncoder()
@@ -4,7 +4,7 @@ import re
 import random
 from model import legal_predictor
 from legal_data import (
-    ipc_sections, it_act_sections, mv_act_sections,
+    get_section_options,
     get_offense_details, get_bail_information
 )
 from utils import extract_section_numbers
@@ -306,12 +306,7 @@ with tab2:
     act_code = act_options[selected_act]
     
     # Show relevant sections based on selected act
-    if act_code == "IPC":
-        section_options = {f"Section {k}: {v}": k for k, v in ipc_sections.items()}
-    elif act_code == "IT Act":
-        section_options = {f"Section {k}: {v}": k for k, v in it_act_sections.items()}
-    else:  # MV Act
-        section_options = {f"Section {k}: {v}": k for k, v in mv_act_sections.items()}
+    section_options = get_section_options(act_code)
     
     selected_section_display = st.selectbox("Select Section", options=list(section_options.keys()), key="manual_section")
     selected_section = section_options[selected_section_display]
@@ -0,0 +1,135 @@
+"""
+Precedent store indexed by (act, section).
+
+A precedent's section field may name several sections ("66, 43"). It is
+parsed once when the precedent is added, and the precedent is filed under
+each (act, section) key, so lookups are exact: section "30" no longer
+matches a precedent on "302". Per-key results are cached as tuples and
+shared by every caller until a precedent is added under that key.
+
+Precedents are stored as read-only records (lists become tuples), so the
+shared tuples can be handed out without one caller modifying a precedent
+for the others. The store's version changes on every addition; indexes
+built over the store (precedent search, legal data search) compare it to
+pick up new precedents.
+"""
+
+import threading
+from types import MappingProxyType
+
+
+def parse_sections(section_field):
+    """
+    Split a precedent's section field into individual section numbers.
+
+    Args:
+        section_field (str): e.g. "66, 43"
+
+    Returns:
+        list: e.g. ["66", "43"]
+    """
+    return [section.strip() for section in str(section_field).split(",") if section.strip()]
+
+
+def _freeze_precedent(precedent):
+    """Read-only copy of a precedent dictionary, with list fields as tuples."""
+    return MappingProxyType({
+        key: tuple(value) if isinstance(value, list) else value
+        for key, value in precedent.items()
+    })
+
+
+class PrecedentStore:
+    """
+    Precedents with an exact (act, section) index.
+    """
+
+    def __init__(self, precedents=()):
+        """
+        Build the store.
+
+        Args:
+            precedents (iterable): Precedent dictionaries with act and section
+        """
+        self.precedents = []
+        # (act, section) -> positions in self.precedents
+        self._rows_by_key = {}
+        self._cache = {}
+        self._lock = threading.Lock()
+        self.version = 0
+        self.extend(precedents)
+
+    def __len__(self):
+        return len(self.precedents)
+
+    def __iter__(self):
+        return iter(self.precedents)
+
+    def extend(self, precedents):
+        """
+        Add precedents to the store.
+
+        Args:
+            precedents (iterable): Precedent dictionaries with act and section;
+                the store keeps read-only copies
+        """
+        with self._lock:
+            for precedent in precedents:
+                row = len(self.precedents)
+                self.precedents.append(_freeze_precedent(precedent))
+                for section in dict.fromkeys(parse_sections(precedent["section"])):
+                    key = (precedent["act"], section)
+                    self._rows_by_key.setdefault(key, []).append(row)
+                    self._cache.pop(key, None)
+            self.version += 1
+
+    def add(self, precedent):
+        """
+        Add one precedent to the store.
+
+        Args:
+            precedent (dict): Precedent with act and section
+        """
+        self.extend([precedent])
+
+    def _lookup(self, section, act):
+        """Cached (rows, precedents) tuples for an (act, section) key."""
+        key = (act, str(section).strip())
+        cached = self._cache.get(key)
+        if cached is None:
+            with self._lock:
+                rows = tuple(self._rows_by_key.get(key, ()))
+                cached = (rows, tuple(self.precedents[row] for row in rows))
+                self._cache[key] = cached
+        return cached
+
+    def rows_for_section(self, section, act="IPC"):
+        """
+        Get the positions of the precedents on a section.
+
+        Args:
+            section (str): Section number, e.g. "302"
+            act (str): Act name
+
+        Returns:
+            tuple: Positions in self.precedents, in the order they were added
+        """
+        return self._lookup(section, act)[0]
+
+    def for_section(self, section, act="IPC"):
+        """
+        Get the precedents on a section.
+
+        Args:
+            section (str): Section number, e.g. "302"
+            act (str): Act name
+
+        Returns:
+            tuple: Read-only precedent records in the order they were added,
+                shared between callers
+        """
+        return self._lookup(section, act)[1]
+
+    def keys(self):
+        """All (act, section) keys with at least one precedent."""
+        return list(self._rows_by_key)
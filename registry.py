@@ -0,0 +1,198 @@
+"""
+Lazily constructed, process-wide singletons.
+
+Modules register a factory for their expensive shared objects (the legal
+predictor, argument generator and case matcher) instead of building them at
+import time, and export a LazySingleton proxy in their place. The object is
+built on first attribute access, exactly once per process even under
+concurrent Streamlit sessions, and the build time is recorded.
+
+prewarm() builds everything in a background thread at server start so the
+first user request does not pay for it. Inside a running Streamlit app the
+instances are also handed out through st.cache_resource, so every session of
+the worker shares the same object.
+"""
+
+import importlib
+import os
+import sys
+import threading
+import time
+
+# Modules whose singletons are built by prewarm()
+PREWARM_MODULES = ("model", "argument_generator", "semantic_search")
+
+# Set PREWARM_SINGLETONS=0 to build singletons only on first use
+PREWARM_ENABLED = os.environ.get("PREWARM_SINGLETONS", "1").lower() not in ("0", "false", "no")
+
+_factories = {}
+_instances = {}
+_locks = {}
+_registry_lock = threading.Lock()
+_prewarm_started = False
+_prewarm_thread = None
+_streamlit_get = None
+build_times = {}
+
+
+def register(name, factory):
+    """
+    Register the factory of a named singleton.
+
+    Args:
+        name (str): Singleton name
+        factory (callable): Builds the instance; called at most once
+    """
+    with _registry_lock:
+        _factories[name] = factory
+        _locks.setdefault(name, threading.Lock())
+
+
+def get(name):
+    """
+    Return a singleton, building it on first use.
+
+    Args:
+        name (str): Singleton name
+
+    Returns:
+        The shared instance
+
+    Raises:
+        KeyError: If no factory is registered under name
+    """
+    if name in _instances:
+        return _instances[name]
+
+    with _registry_lock:
+        factory = _factories[name]
+        lock = _locks[name]
+
+    with lock:
+        if name not in _instances:
+            start = time.perf_counter()
+            _instances[name] = factory()
+            build_times[name] = time.perf_counter() - start
+    return _instances[name]
+
+
+def is_ready(name):
+    """Whether a singleton has already been built."""
+    return name in _instances
+
+
+def shared(name):
+    """
+    Return a singleton, through st.cache_resource when running in Streamlit.
+
+    Streamlit is only used if the app has already imported it, so scripts
+    and benchmarks using the singletons never pay for importing it.
+
+    Args:
+        name (str): Singleton name
+
+    Returns:
+        The shared instance
+    """
+    global _streamlit_get
+
+    if "streamlit" not in sys.modules:
+        return get(name)
+
+    if _streamlit_get is None:
+        st = sys.modules["streamlit"]
+        _streamlit_get = st.cache_resource(show_spinner=False)(get)
+    return _streamlit_get(name)
+
+
+class LazySingleton:
+    """
+    A stand-in for a module-level singleton that builds it on first use.
+
+    Attribute access is forwarded to the real instance, so existing code such
+    as ``from model import legal_predictor`` keeps working unchanged.
+    """
+
+    def __init__(self, name, factory):
+        """
+        Register the factory and create the proxy.
+
+        Args:
+            name (str): Singleton name
+            factory (callable): Builds the instance
+        """
+        object.__setattr__(self, "_name", name)
+        register(name, factory)
+
+    def __getattr__(self, attr):
+        return getattr(shared(self._name), attr)
+
+    def __setattr__(self, attr, value):
+        setattr(shared(self._name), attr, value)
+
+    def __repr__(self):
+        state = "ready" if is_ready(self._name) else "not built"
+        return f"<LazySingleton {self._name} ({state})>"
+
+
+def _prewarm(modules):
+    """Import modules and build every registered singleton."""
+    for module in modules:
+        try:
+            importlib.import_module(module)
+        except Exception as e:
+            print(f"Error importing {module} for prewarm: {str(e)}")
+
+    with _registry_lock:
+        names = list(_factories)
+
+    for name in names:
+        try:
+            get(name)
+        except Exception as e:
+            print(f"Error prewarming {name}: {str(e)}")
+
+
+def prewarm(modules=PREWARM_MODULES, background=True):
+    """
+    Build the app's singletons ahead of the first request.
+
+    Safe to call on every script run: only the first call does any work.
+
+    Args:
+        modules (tuple): Modules to import so their singletons are registered
+        background (bool): Build in a daemon thread instead of blocking
+
+    Returns:
+        threading.Thread: The prewarm thread, or None if prewarming is
+            disabled or ran in the foreground
+    """
+    global _prewarm_started, _prewarm_thread
+
+    if not PREWARM_ENABLED:
+        return None
+
+    with _registry_lock:
+        if _prewarm_started:
+            return _prewarm_thread
+        _prewarm_started = True
+
+    if not background:
+        _prewarm(modules)
+        return None
+
+    _prewarm_thread = threading.Thread(target=_prewarm, args=(modules,), name="singleton-prewarm", daemon=True)
+    _prewarm_thread.start()
+    return _prewarm_thread
+
+
+def warmup_report():
+    """
+    Report which singletons are built and how long each took.
+
+    Returns:
+        dict: Singleton name -> build time in milliseconds, or None if not built
+    """
+    with _registry_lock:
+        names = list(_factories)
+    return {name: build_times[name] * 1000 if name in build_times else None for name in names}
@@ -0,0 +1,120 @@
+"""
+Bounded LRU/TTL cache for search results.
+
+Callers build keys that include everything the result depends on, including
+the version of the index that produced it, so entries for an outdated index
+are simply never hit again and age out of the LRU. The cache is guarded by a
+lock because Streamlit sessions share module-level singletons across threads.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+
+# Default number of cached results
+DEFAULT_MAX_ENTRIES = 512
+
+# Default lifetime of a cached result in seconds
+DEFAULT_TTL_SECONDS = 600
+
+
+def normalize_query(text):
+    """
+    Normalize free text for use in a cache key.
+
+    Args:
+        text (str): Query text
+
+    Returns:
+        str: Casefolded text with whitespace collapsed
+    """
+    return " ".join((text or "").casefold().split())
+
+
+class ResultCache:
+    """
+    A thread-safe LRU cache with per-entry expiry and hit/miss counters.
+    """
+
+    def __init__(self, max_entries=DEFAULT_MAX_ENTRIES, ttl_seconds=DEFAULT_TTL_SECONDS):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries (int): Maximum number of entries before the least
+                recently used one is evicted
+            ttl_seconds (float, optional): Entry lifetime; None disables expiry
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, key, default=None):
+        """
+        Look up a cached value.
+
+        Args:
+            key (hashable): Cache key
+            default: Value returned on a miss
+
+        Returns:
+            The cached value, or default if missing or expired
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, value = entry
+                if expires_at is None or expires_at > time.monotonic():
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self._entries[key]
+                self.expirations += 1
+            self.misses += 1
+            return default
+
+    def put(self, key, value):
+        """
+        Store a value, evicting the least recently used entry if full.
+
+        Args:
+            key (hashable): Cache key
+            value: Value to cache
+        """
+        expires_at = time.monotonic() + self.ttl_seconds if self.ttl_seconds is not None else None
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        """Remove all entries; counters are kept."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        """
+        Report cache usage, e.g. for sizing max_entries and ttl_seconds.
+
+        Returns:
+            dict: Hits, misses, hit rate, evictions, expirations and size
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "size": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl_seconds
+            }
@@ -0,0 +1,798 @@
+"""
+Pre-fitted TF-IDF index for legal case retrieval.
+
+The index fits its vectorizer once over the case corpus and keeps the
+L2-normalized sparse document matrix, so a query only needs a single
+``transform`` and a sparse dot product instead of refitting the whole corpus.
+Indexes can be saved to and loaded from disk and carry a fingerprint of the
+corpus they were built from so callers can tell when a rebuild is needed.
+
+Documents can also be added and removed incrementally. New documents are
+vectorized with the existing vocabulary and IDF weights and appended as new
+rows; removed documents are tombstoned. Both kinds of change leave the IDF
+statistics slightly stale, so they are refreshed lazily by compaction once the
+number of pending changes passes a threshold.
+
+Top-k retrieval runs over an inverted index derived from the document
+matrix. Query terms are visited in order of their maximum possible score
+contribution (MaxScore): once the k-th best score found so far exceeds what
+the remaining terms could add, those terms only update existing candidates
+and hopeless candidates are dropped, so most postings are never merged.
+Incrementally added rows are appended to the inverted index as a small
+delta segment instead of rebuilding it.
+"""
+
+import copy
+import hashlib
+import os
+import pickle
+import threading
+
+import numpy as np
+import scipy.sparse as sp
+from sklearn.base import clone
+from sklearn.preprocessing import normalize
+
+# Default on-disk location for the case index
+INDEX_PATH = os.path.join("assets", "index", "case_index.pkl")
+
+# Bumped whenever the pickled layout or text preprocessing changes so stale
+# files are rebuilt
+INDEX_FORMAT_VERSION = 3
+
+# Fraction of live documents that may be added or removed since the last fit
+# before the index is compacted and the IDF statistics are refreshed
+REFRESH_THRESHOLD = 0.2
+
+
+def top_k_indices(scores, k):
+    """
+    Return the indices of the k highest scores, best first.
+
+    Uses ``np.argpartition`` so only the selected slice is sorted.
+
+    Args:
+        scores (numpy.ndarray): Scores to rank
+        k (int): Number of indices to return
+
+    Returns:
+        numpy.ndarray: Indices of the top-k scores in descending score order
+    """
+    if k <= 0 or len(scores) == 0:
+        return np.zeros(0, dtype=np.int64)
+    if k < len(scores):
+        candidates = np.argpartition(-scores, k - 1)[:k]
+    else:
+        candidates = np.arange(len(scores))
+    # Tie-break on index so results are deterministic
+    return candidates[np.lexsort((candidates, -scores[candidates]))]
+
+
+def corpus_fingerprint(case_texts):
+    """
+    Compute a stable fingerprint for a list of case texts.
+
+    Args:
+        case_texts (list): List of case texts
+
+    Returns:
+        str: Hex digest identifying the corpus contents and order
+    """
+    digest = hashlib.sha1()
+    for text in case_texts:
+        digest.update((text or "").encode("utf-8", errors="ignore"))
+        digest.update(b"\x00")
+    return digest.hexdigest()
+
+
+class InvertedIndex:
+    """
+    Term -> postings index over an L2-normalized document matrix with
+    MaxScore early termination for top-k retrieval.
+
+    Postings live in a base segment built from the whole matrix and a delta
+    segment holding rows appended since. Appended rows always get higher
+    document ids than the base rows, so a term's postings stay sorted when
+    its delta postings follow its base postings.
+    """
+
+    def __init__(self, doc_matrix):
+        """
+        Build postings lists from a document-term matrix.
+
+        Args:
+            doc_matrix (scipy.sparse.spmatrix): n_docs x n_terms weight matrix
+        """
+        self.indptr, self.doc_ids, self.weights = self._segment(doc_matrix)
+        self.n_docs = doc_matrix.shape[0]
+        self.base_docs = self.n_docs
+        self.delta_rows = None
+        self.delta_indptr = None
+        self.delta_doc_ids = None
+        self.delta_weights = None
+
+        # Upper bound of each term's weight over all documents
+        self.max_weights = np.zeros(doc_matrix.shape[1], dtype=np.float64)
+        non_empty = np.flatnonzero(np.diff(self.indptr))
+        if len(non_empty):
+            self.max_weights[non_empty] = np.maximum.reduceat(self.weights, self.indptr[non_empty])
+
+    @staticmethod
+    def _segment(rows, first_doc=0):
+        """Postings arrays (indptr, document ids, weights) for a block of rows."""
+        postings = sp.csc_matrix(rows)
+        postings.sort_indices()
+        doc_ids = postings.indices + first_doc if first_doc else postings.indices
+        return postings.indptr, doc_ids, postings.data
+
+    def append(self, rows):
+        """
+        Return an index that also covers rows appended after the current ones.
+
+        Only the delta segment is rebuilt, so the cost depends on the rows
+        added since the index was built, not on the corpus size. This index
+        is left unchanged for readers still using it.
+
+        Args:
+            rows (scipy.sparse.spmatrix): n_new x n_terms weight matrix for
+                documents n_docs .. n_docs + n_new - 1
+
+        Returns:
+            InvertedIndex: The extended index
+        """
+        extended = copy.copy(self)
+        delta_rows = rows if self.delta_rows is None else sp.vstack([self.delta_rows, rows], format="csr")
+        extended.delta_rows = delta_rows
+        extended.delta_indptr, extended.delta_doc_ids, extended.delta_weights = self._segment(
+            delta_rows, self.base_docs
+        )
+        extended.n_docs = self.n_docs + rows.shape[0]
+        # Weights are non-negative, so the column maximum is the new upper bound
+        extended.max_weights = np.maximum(self.max_weights, sp.csc_matrix(rows).max(axis=0).toarray().ravel())
+        return extended
+
+    def postings(self, term):
+        """
+        Return the postings of a term.
+
+        Args:
+            term (int): Column index of the term in the vocabulary
+
+        Returns:
+            tuple: (sorted document ids, weights) arrays
+        """
+        start, end = self.indptr[term], self.indptr[term + 1]
+        doc_ids, weights = self.doc_ids[start:end], self.weights[start:end]
+        if self.delta_indptr is not None:
+            delta_start, delta_end = self.delta_indptr[term], self.delta_indptr[term + 1]
+            if delta_end > delta_start:
+                doc_ids = np.concatenate([doc_ids, self.delta_doc_ids[delta_start:delta_end]])
+                weights = np.concatenate([weights, self.delta_weights[delta_start:delta_end]])
+        return doc_ids, weights
+
+    def top_k(self, query_vector, k, min_score=0.0, live=None):
+        """
+        Retrieve the k documents with the highest dot product with the query.
+
+        Args:
+            query_vector (scipy.sparse.spmatrix): 1 x n_terms query vector
+            k (int): Number of documents to return
+            min_score (float): Only documents scoring above this are returned
+            live (numpy.ndarray, optional): Boolean mask of searchable documents
+
+        Returns:
+            list: (document index, score) tuples, best match first
+        """
+        query = sp.csr_matrix(query_vector)
+        terms = query.indices
+        upper_bounds = query.data * self.max_weights[terms]
+        useful = upper_bounds > 0
+        terms, query_weights, upper_bounds = terms[useful], query.data[useful], upper_bounds[useful]
+        if k <= 0 or len(terms) == 0:
+            return []
+
+        # Visit terms with the largest possible contribution first;
+        # remaining[i] bounds what terms i.. can still add to any document
+        order = np.argsort(-upper_bounds, kind="stable")
+        terms, query_weights = terms[order], query_weights[order]
+        remaining = np.append(np.cumsum(upper_bounds[order][::-1])[::-1], 0.0)
+
+        threshold = min_score
+        cand_ids = np.zeros(0, dtype=self.doc_ids.dtype)
+        cand_scores = np.zeros(0, dtype=np.float64)
+
+        for i, term in enumerate(terms):
+            ids, weights = self.postings(term)
+            contributions = weights * query_weights[i]
+
+            if remaining[i] < threshold:
+                # Non-essential term: no unseen document can reach the
+                # threshold any more, so only update existing candidates
+                if len(cand_ids) == 0:
+                    break
+                positions = np.searchsorted(ids, cand_ids)
+                found = positions < len(ids)
+                found[found] = ids[positions[found]] == cand_ids[found]
+                cand_scores[found] += contributions[positions[found]]
+            else:
+                merged = np.union1d(cand_ids, ids)
+                scores = np.zeros(len(merged), dtype=np.float64)
+                scores[np.searchsorted(merged, cand_ids)] += cand_scores
+                scores[np.searchsorted(merged, ids)] += contributions
+                if live is not None:
+                    alive = live[merged]
+                    merged, scores = merged[alive], scores[alive]
+                cand_ids, cand_scores = merged, scores
+
+            if len(cand_ids) >= k:
+                kth_score = np.partition(cand_scores, len(cand_scores) - k)[len(cand_scores) - k]
+                threshold = max(threshold, kth_score)
+
+            # Drop candidates that cannot reach the threshold even if they
+            # match every remaining term
+            viable = cand_scores + remaining[i + 1] >= threshold
+            if not viable.all():
+                cand_ids, cand_scores = cand_ids[viable], cand_scores[viable]
+
+        keep = cand_scores > min_score
+        cand_ids, cand_scores = cand_ids[keep], cand_scores[keep]
+        best = top_k_indices(cand_scores, k)
+        return [(int(cand_ids[idx]), float(cand_scores[idx])) for idx in best]
+
+
+class LegalCaseIndex:
+    """
+    A build-once TF-IDF index over a corpus of legal case texts.
+    """
+
+    def __init__(self, vectorizer, refresh_threshold=REFRESH_THRESHOLD):
+        """
+        Initialize an empty index.
+
+        Args:
+            vectorizer (TfidfVectorizer): Template vectorizer; a fresh clone is
+                fitted on build so the template itself is never mutated
+            refresh_threshold (float): Fraction of changed documents that
+                triggers compaction and an IDF refresh
+        """
+        self.vectorizer = clone(vectorizer)
+        self.refresh_threshold = refresh_threshold
+        self.doc_matrix = None
+        self.case_texts = []
+        self.processed_texts = []
+        self.case_metadata = []
+        self.doc_ids = np.zeros(0, dtype=np.int64)
+        self.live = np.zeros(0, dtype=bool)
+        self.next_doc_id = 0
+        self.pending_changes = 0
+        self._fingerprint = None
+        self.version = 0
+        self._rows_by_id = {}
+        self._inverted = None
+        self.term_weights = {}
+        self._query_weights = None
+
+    @property
+    def size(self):
+        """Number of live (non-deleted) documents in the index."""
+        return int(self.live.sum())
+
+    def live_texts(self):
+        """Return the texts of all live documents in index order."""
+        return [text for text, alive in zip(self.case_texts, self.live) if alive]
+
+    @property
+    def fingerprint(self):
+        """
+        Fingerprint of the live documents, computed on first use after a change.
+
+        Hashing every live text is proportional to the corpus size, so adds
+        and removes only invalidate it rather than recomputing it each time.
+        """
+        if self._fingerprint is None:
+            self._fingerprint = corpus_fingerprint(self.live_texts())
+        return self._fingerprint
+
+    def _refresh_fingerprint(self):
+        """Mark the corpus fingerprint stale after the live documents changed."""
+        self._fingerprint = None
+
+    def with_metadata(self, case_metadata):
+        """
+        Return an index over the same documents with replaced metadata.
+
+        Tombstoned rows stay in the document matrix until compaction, so the
+        metadata, which describes the live documents in order, is mapped onto
+        the live rows. This index is left unchanged for readers still using it.
+
+        Args:
+            case_metadata (list): Metadata dictionaries for the live documents,
+                in the same order as live_texts()
+
+        Returns:
+            LegalCaseIndex: The index with the new metadata
+        """
+        live_rows = np.flatnonzero(self.live)
+        if len(live_rows) == len(self.case_texts):
+            metadata = list(case_metadata)
+        else:
+            metadata = list(self.case_metadata)
+            metadata.extend({} for _ in range(len(self.case_texts) - len(metadata)))
+            for row, row_metadata in zip(live_rows, case_metadata):
+                metadata[row] = row_metadata
+
+        index = copy.copy(self)
+        index.case_metadata = metadata
+        return index
+
+    def _reindex_rows(self):
+        """Rebuild the document id -> row mapping."""
+        self._rows_by_id = {int(doc_id): row for row, doc_id in enumerate(self.doc_ids)}
+
+    def copy(self):
+        """
+        Copy the index so it can be changed while readers keep using this one.
+
+        The fitted vectorizer and the document matrix are replaced rather than
+        modified by every change, so they are shared with the copy; the
+        per-document lists and arrays are copied.
+
+        Returns:
+            LegalCaseIndex: An independent index with the same contents
+        """
+        index = copy.copy(self)
+        index.case_texts = list(self.case_texts)
+        index.processed_texts = list(self.processed_texts)
+        index.case_metadata = list(self.case_metadata)
+        index.doc_ids = self.doc_ids.copy()
+        index.live = self.live.copy()
+        index._rows_by_id = dict(self._rows_by_id)
+        index.term_weights = dict(self.term_weights)
+        return index
+
+    def build(self, case_texts, processed_texts, case_metadata=None):
+        """
+        Fit the vectorizer and store the normalized document matrix.
+
+        Args:
+            case_texts (list): Original case texts, returned with results
+            processed_texts (list): Preprocessed texts used for vectorization
+            case_metadata (list, optional): Metadata dictionaries for each case
+
+        Returns:
+            LegalCaseIndex: The index itself, for chaining
+        """
+        vectorizer = clone(self.vectorizer)
+        # TfidfVectorizer L2-normalizes rows by default, so the dot product of
+        # two rows is already their cosine similarity
+        doc_matrix = vectorizer.fit_transform(processed_texts).tocsr()
+
+        self.vectorizer = vectorizer
+        self.doc_matrix = doc_matrix
+        self.case_texts = list(case_texts)
+        self.processed_texts = list(processed_texts)
+        self.case_metadata = list(case_metadata) if case_metadata else []
+        self.doc_ids = np.arange(self.next_doc_id, self.next_doc_id + len(self.case_texts), dtype=np.int64)
+        self.next_doc_id += len(self.case_texts)
+        self.live = np.ones(len(self.case_texts), dtype=bool)
+        self.pending_changes = 0
+        self._reindex_rows()
+        self._refresh_fingerprint()
+        self.version += 1
+        return self
+
+    def add(self, case_texts, processed_texts, case_metadata=None):
+        """
+        Append new documents without refitting the vectorizer.
+
+        The new rows use the current vocabulary and IDF weights; terms that
+        are not in the vocabulary yet become searchable after the next
+        compaction.
+
+        Args:
+            case_texts (list): Original texts of the new cases
+            processed_texts (list): Preprocessed texts of the new cases
+            case_metadata (list, optional): Metadata dictionaries for the new cases
+
+        Returns:
+            list: Document ids assigned to the new cases
+        """
+        if not case_texts:
+            return []
+        if self.doc_matrix is None:
+            self.build(case_texts, processed_texts, case_metadata)
+            return [int(doc_id) for doc_id in self.doc_ids]
+
+        count = len(case_texts)
+        new_ids = np.arange(self.next_doc_id, self.next_doc_id + count, dtype=np.int64)
+        self.next_doc_id += count
+
+        # Keep metadata aligned with rows once any document carries metadata
+        if case_metadata or self.case_metadata:
+            if len(self.case_metadata) < len(self.case_texts):
+                self.case_metadata.extend({} for _ in range(len(self.case_texts) - len(self.case_metadata)))
+            self.case_metadata.extend(case_metadata if case_metadata else [{} for _ in range(count)])
+
+        new_rows = self.vectorizer.transform(processed_texts)
+        previous_matrix, inverted = self.doc_matrix, self._inverted
+        self.doc_matrix = sp.vstack([self.doc_matrix, new_rows], format="csr")
+        if inverted is not None and inverted[0] is previous_matrix:
+            # Extend the existing postings rather than rebuilding them on the next search
+            self._inverted = (self.doc_matrix, inverted[1].append(new_rows))
+        self.case_texts.extend(case_texts)
+        self.processed_texts.extend(processed_texts)
+        self.doc_ids = np.concatenate([self.doc_ids, new_ids])
+        self.live = np.concatenate([self.live, np.ones(count, dtype=bool)])
+        for offset, doc_id in enumerate(new_ids):
+            self._rows_by_id[int(doc_id)] = len(self.case_texts) - count + offset
+
+        self.pending_changes += count
+        self._after_change()
+        return [int(doc_id) for doc_id in new_ids]
+
+    def remove(self, doc_ids):
+        """
+        Tombstone documents so they no longer appear in search results.
+
+        Args:
+            doc_ids (list): Document ids returned by ``add`` or ``build``
+
+        Returns:
+            int: Number of documents that were removed
+        """
+        removed = 0
+        for doc_id in doc_ids:
+            row = self._rows_by_id.get(int(doc_id))
+            if row is not None and self.live[row]:
+                self.live[row] = False
+                removed += 1
+
+        if removed:
+            self.pending_changes += removed
+            self._after_change()
+        return removed
+
+    def _after_change(self):
+        """Bump the version and compact once enough changes have accumulated."""
+        if self.pending_changes > self.refresh_threshold * max(self.size, 1):
+            self.compact()
+        else:
+            self._refresh_fingerprint()
+            self.version += 1
+
+    def compact(self):
+        """
+        Drop tombstoned documents and refit the vectorizer on the live ones.
+
+        This refreshes the vocabulary and IDF statistics. Document ids are
+        preserved across compaction.
+        """
+        keep = np.flatnonzero(self.live)
+        case_texts = [self.case_texts[row] for row in keep]
+        processed_texts = [self.processed_texts[row] for row in keep]
+        case_metadata = [self.case_metadata[row] for row in keep] if self.case_metadata else []
+        doc_ids = self.doc_ids[keep]
+        next_doc_id = self.next_doc_id
+
+        if not case_texts:
+            self.doc_matrix = None
+            self.case_texts, self.processed_texts, self.case_metadata = [], [], []
+            self.doc_ids = doc_ids
+            self.live = np.zeros(0, dtype=bool)
+            self.pending_changes = 0
+            self._reindex_rows()
+            self._refresh_fingerprint()
+            self.version += 1
+            return
+
+        self.build(case_texts, processed_texts, case_metadata)
+        self.doc_ids = doc_ids
+        self.next_doc_id = next_doc_id
+        self._reindex_rows()
+
+    def set_term_weights(self, term_weights):
+        """
+        Set query-side weights for individual terms.
+
+        Weights are applied to transformed query vectors as a sparse diagonal
+        reweighting, so document vectors and the fitted vocabulary are
+        unaffected and no query text needs to be re-tokenized.
+
+        Args:
+            term_weights (dict): Term (in preprocessed token form) -> weight
+        """
+        self.term_weights = dict(term_weights)
+        self._query_weights = None
+
+    def _query_weight_matrix(self):
+        """Diagonal term weight matrix for the current vocabulary, built on first use."""
+        if self._query_weights is None or self._query_weights[0] is not self.vectorizer:
+            vocabulary = self.vectorizer.vocabulary_
+            weights = np.ones(len(vocabulary), dtype=np.float64)
+            for term, weight in self.term_weights.items():
+                column = vocabulary.get(term)
+                if column is not None:
+                    weights[column] = weight
+            self._query_weights = (self.vectorizer, sp.diags(weights, format="csr"))
+        return self._query_weights[1]
+
+    def transform_queries(self, processed_queries):
+        """
+        Vectorize preprocessed queries with the fitted vocabulary and term weights.
+
+        Args:
+            processed_queries (list): Preprocessed query texts
+
+        Returns:
+            scipy.sparse.csr_matrix: n_queries x n_features L2-normalized query vectors
+        """
+        query_matrix = self.vectorizer.transform(processed_queries)
+        if self.term_weights:
+            query_matrix = normalize(query_matrix @ self._query_weight_matrix())
+        return query_matrix
+
+    def transform(self, processed_query):
+        """
+        Vectorize a preprocessed query with the fitted vocabulary and term weights.
+
+        Args:
+            processed_query (str): Preprocessed query text
+
+        Returns:
+            scipy.sparse.csr_matrix: 1 x n_features L2-normalized query vector
+        """
+        return self.transform_queries([processed_query])
+
+    def score(self, query_vector):
+        """
+        Compute cosine similarity between a query vector and every document.
+
+        Args:
+            query_vector (scipy.sparse.csr_matrix): Output of ``transform``
+
+        Returns:
+            numpy.ndarray: Similarity score for each document
+        """
+        similarities = np.asarray((self.doc_matrix @ query_vector.T).todense()).ravel()
+        # Tombstoned documents never match
+        similarities[~self.live] = 0.0
+        return similarities
+
+    @property
+    def inverted_index(self):
+        """Inverted index over the current document matrix, built on first use."""
+        if self._inverted is None or self._inverted[0] is not self.doc_matrix:
+            self._inverted = (self.doc_matrix, InvertedIndex(self.doc_matrix))
+        return self._inverted[1]
+
+    def search(self, processed_query, top_k=5, min_score=0.0):
+        """
+        Return the top-k documents for a preprocessed query.
+
+        Args:
+            processed_query (str): Preprocessed query text
+            top_k (int): Number of top matches to return
+            min_score (float): Only matches with similarity above this are returned
+
+        Returns:
+            list: (document index, similarity) tuples, best match first
+        """
+        if self.doc_matrix is None or self.size == 0:
+            return []
+
+        return self.inverted_index.top_k(
+            self.transform(processed_query), top_k, min_score=min_score, live=self.live
+        )
+
+    def search_batch(self, processed_queries, top_k=5, min_score=0.0):
+        """
+        Return the top-k documents for several preprocessed queries at once.
+
+        All queries are transformed into one sparse matrix and scored with a
+        single sparse-by-sparse product, so only documents sharing a term with
+        a query are ever materialized.
+
+        Args:
+            processed_queries (list): Preprocessed query texts
+            top_k (int): Number of top matches to return per query
+            min_score (float): Only matches with similarity above this are returned
+
+        Returns:
+            list: One list of (document index, similarity) tuples per query
+        """
+        if self.doc_matrix is None or self.size == 0:
+            return [[] for _ in processed_queries]
+        if not processed_queries:
+            return []
+
+        query_matrix = self.transform_queries(processed_queries)
+        similarities = (query_matrix @ self.doc_matrix.T).tocsr()
+
+        results = []
+        for row in range(similarities.shape[0]):
+            start, end = similarities.indptr[row], similarities.indptr[row + 1]
+            doc_indices = similarities.indices[start:end]
+            scores = similarities.data[start:end]
+
+            keep = self.live[doc_indices] & (scores > min_score)
+            doc_indices, scores = doc_indices[keep], scores[keep]
+
+            best = top_k_indices(scores, top_k)
+            results.append([(int(doc_indices[idx]), float(scores[idx])) for idx in best])
+        return results
+
+    def save(self, path=INDEX_PATH):
+        """
+        Persist the index to disk.
+
+        Args:
+            path (str): Destination file path
+        """
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        state = {
+            "format_version": INDEX_FORMAT_VERSION,
+            "vectorizer": self.vectorizer,
+            "refresh_threshold": self.refresh_threshold,
+            "doc_matrix": self.doc_matrix,
+            "case_texts": self.case_texts,
+            "processed_texts": self.processed_texts,
+            "case_metadata": self.case_metadata,
+            "doc_ids": self.doc_ids,
+            "live": self.live,
+            "next_doc_id": self.next_doc_id,
+            "pending_changes": self.pending_changes,
+            "fingerprint": self.fingerprint,
+            "version": self.version,
+        }
+
+        # Write to a temporary file first so readers never see a partial index;
+        # the temporary name is unique per writer so concurrent saves do not collide
+        tmp_path = f"{path}.{os.getpid()}-{threading.get_ident()}.tmp"
+        with open(tmp_path, "wb") as f:
+            pickle.dump(state, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path=INDEX_PATH):
+        """
+        Load an index previously written with ``save``.
+
+        Args:
+            path (str): Source file path
+
+        Returns:
+            LegalCaseIndex: The loaded index, or None if the file is missing,
+                unreadable or was written in an older format
+        """
+        if not os.path.exists(path):
+            return None
+
+        try:
+            with open(path, "rb") as f:
+                state = pickle.load(f)
+        except Exception as e:
+            print(f"Error loading case index from {path}: {str(e)}")
+            return None
+
+        if state.get("format_version") != INDEX_FORMAT_VERSION:
+            return None
+
+        index = cls.__new__(cls)
+        index.vectorizer = state["vectorizer"]
+        index.refresh_threshold = state["refresh_threshold"]
+        index.doc_matrix = state["doc_matrix"]
+        index.case_texts = state["case_texts"]
+        index.processed_texts = state["processed_texts"]
+        index.case_metadata = state["case_metadata"]
+        index.doc_ids = state["doc_ids"]
+        index.live = state["live"]
+        index.next_doc_id = state["next_doc_id"]
+        index.pending_changes = state["pending_changes"]
+        index._fingerprint = state["fingerprint"]
+        index.version = state["version"]
+        index._inverted = None
+        index.term_weights = {}
+        index._query_weights = None
+        index._reindex_rows()
+        return index
+
+
+# Relative weight of each precedent field in the precedent vectors
+PRECEDENT_FIELD_WEIGHTS = {
+    "summary": 1.0,
+    "key_points": 0.7
+}
+
+
+class PrecedentIndex:
+    """
+    A pre-fitted TF-IDF index over the precedents in a PrecedentStore.
+
+    Filtered searches only score the store's (act, section) partition.
+    Precedents added to the store later are vectorized with the fitted
+    vocabulary and appended on the next search.
+    """
+
+    def __init__(self, store, vectorizer=None, field_weights=PRECEDENT_FIELD_WEIGHTS):
+        """
+        Index the precedents of a store.
+
+        Args:
+            store (PrecedentStore): Precedents with summary and key_points
+            vectorizer (TfidfVectorizer, optional): Template vectorizer
+            field_weights (dict): Weight of the summary and key_points fields
+        """
+        from sklearn.feature_extraction.text import TfidfVectorizer
+
+        if vectorizer is None:
+            vectorizer = TfidfVectorizer(stop_words="english", ngram_range=(1, 2), sublinear_tf=True)
+
+        self.store = store
+        self.field_weights = field_weights
+        self.vectorizer = clone(vectorizer)
+        self._lock = threading.Lock()
+
+        store_version = store.version
+        precedents = list(store.precedents)
+        self.vectorizer.fit(
+            [p["summary"] for p in precedents] + [" ".join(p["key_points"]) for p in precedents]
+        )
+        self.doc_matrix = self._vectorize(precedents)
+        self.store_version = store_version
+
+    def _vectorize(self, precedents):
+        """Weighted, L2-normalized rows for precedents."""
+        # Each field is vectorized separately and combined with its weight,
+        # then rows are re-normalized so dot products stay cosine similarities
+        return normalize(
+            self.field_weights["summary"] * self.vectorizer.transform([p["summary"] for p in precedents])
+            + self.field_weights["key_points"] * self.vectorizer.transform(
+                [" ".join(p["key_points"]) for p in precedents]
+            )
+        ).tocsr()
+
+    def _sync(self):
+        """Append rows for precedents added to the store since the last search."""
+        if self.store_version == self.store.version:
+            return self.doc_matrix
+
+        with self._lock:
+            if self.store_version != self.store.version:
+                store_version = self.store.version
+                new_precedents = self.store.precedents[self.doc_matrix.shape[0]:]
+                if new_precedents:
+                    self.doc_matrix = sp.vstack([self.doc_matrix, self._vectorize(new_precedents)], format="csr")
+                self.store_version = store_version
+        return self.doc_matrix
+
+    def search(self, query, section=None, act=None, top_k=5):
+        """
+        Rank precedents by similarity to a case description.
+
+        Args:
+            query (str): Case description
+            section (str, optional): Restrict to precedents on this section
+            act (str, optional): Act of the section
+            top_k (int): Number of precedents to return
+
+        Returns:
+            list: (precedent, similarity) tuples, best match first
+        """
+        doc_matrix = self._sync()
+        if section and act:
+            rows = np.array(self.store.rows_for_section(section, act), dtype=np.int64)
+            # Precedents added while this search runs are picked up by the next one
+            rows = rows[rows < doc_matrix.shape[0]]
+            if not len(rows):
+                return []
+        else:
+            rows = np.arange(doc_matrix.shape[0])
+
+        query_vector = self.vectorizer.transform([query])
+        similarities = np.asarray((doc_matrix[rows] @ query_vector.T).todense()).ravel()
+
+        best = top_k_indices(similarities, top_k)
+        return [(self.store.precedents[rows[idx]], float(similarities[idx])) for idx in best]
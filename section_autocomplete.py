@@ -0,0 +1,298 @@
+"""
+Typo-tolerant autocomplete for statute sections.
+
+Section numbers go into a character trie, so a partial number such as "49"
+completes to 498A and friends. Title words go into a sorted word list for
+prefix completion and a SymSpell (symmetric delete) index for fuzzy matching
+under Levenshtein distance, so "cheatng" still finds IPC 420 ("Cheating and
+dishonestly inducing delivery of property").
+
+The selectbox option lists used by the section pickers are built here once
+and shared read-only, instead of every page rebuilding them on each rerun.
+"""
+
+import bisect
+import re
+from types import MappingProxyType
+
+# Maximum edit distance allowed for a query word of a given length
+FUZZY_DISTANCES = ((3, 0), (7, 1))
+MAX_FUZZY_DISTANCE = 2
+
+# Relevance of each kind of match
+SCORE_SECTION_EXACT = 3.0
+SCORE_SECTION_PREFIX = 2.0
+SCORE_WORD_EXACT = 1.0
+SCORE_WORD_PREFIX = 0.8
+SCORE_WORD_FUZZY = 0.6
+
+_WORD = re.compile(r"[a-z]+|\d+[a-z]*")
+
+
+def levenshtein(a, b):
+    """
+    Edit distance between two strings.
+
+    Args:
+        a (str): First string
+        b (str): Second string
+
+    Returns:
+        int: Number of single-character insertions, deletions and substitutions
+    """
+    if len(a) < len(b):
+        a, b = b, a
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, 1):
+        current = [i]
+        for j, char_b in enumerate(b, 1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (char_a != char_b)))
+        previous = current
+    return previous[-1]
+
+
+def fuzzy_distance(word):
+    """Maximum edit distance tolerated for a query word."""
+    for length, distance in FUZZY_DISTANCES:
+        if len(word) <= length:
+            return distance
+    return MAX_FUZZY_DISTANCE
+
+
+class SectionTrie:
+    """
+    A character trie from section numbers to the sections that carry them.
+    """
+
+    def __init__(self):
+        self.root = {}
+
+    def insert(self, key, value):
+        """
+        Add a value under a key.
+
+        Args:
+            key (str): Lowercased section number
+            value: Entry id stored at the key
+        """
+        node = self.root
+        for char in key:
+            node = node.setdefault(char, {})
+        node.setdefault("", []).append(value)
+
+    def exact(self, key):
+        """Values stored exactly under key."""
+        node = self._find(key)
+        return list(node.get("", ())) if node is not None else []
+
+    def complete(self, prefix):
+        """
+        Values stored under every key starting with prefix.
+
+        Args:
+            prefix (str): Lowercased partial section number
+
+        Returns:
+            list: Values, shorter keys first
+        """
+        node = self._find(prefix)
+        if node is None:
+            return []
+
+        values = []
+        level = [node]
+        while level:
+            next_level = []
+            for current in level:
+                values.extend(current.get("", ()))
+                next_level.extend(child for char, child in sorted(current.items()) if char)
+            level = next_level
+        return values
+
+    def _find(self, key):
+        node = self.root
+        for char in key:
+            node = node.get(char)
+            if node is None:
+                return None
+        return node
+
+
+def deletes(word, max_distance):
+    """
+    Every string obtainable from word by deleting up to max_distance characters.
+
+    Args:
+        word (str): Word
+        max_distance (int): Maximum number of deletions
+
+    Returns:
+        set: Deletion variants, word included
+    """
+    variants = {word}
+    frontier = {word}
+    for _ in range(max_distance):
+        frontier = {variant[:i] + variant[i + 1:] for variant in frontier for i in range(len(variant))}
+        variants |= frontier
+    return variants
+
+
+class SymSpellIndex:
+    """
+    Symmetric-delete index over words for fuzzy lookup under Levenshtein
+    distance.
+
+    Two words within distance k always share a variant reachable by at most
+    k deletions from each, so a lookup generates the query's deletion
+    variants, collects the words indexed under them, and verifies only those
+    few candidates with the exact edit distance.
+    """
+
+    def __init__(self, words=(), max_distance=MAX_FUZZY_DISTANCE):
+        """
+        Build the index.
+
+        Args:
+            words (iterable): Vocabulary
+            max_distance (int): Largest edit distance supported by search
+        """
+        self.max_distance = max_distance
+        self.variants = {}
+        for word in words:
+            for variant in deletes(word, max_distance):
+                self.variants.setdefault(variant, set()).add(word)
+
+    def search(self, word, max_distance):
+        """
+        Find vocabulary words within max_distance of word.
+
+        Args:
+            word (str): Query word
+            max_distance (int): Largest edit distance to accept, at most the
+                index's max_distance
+
+        Returns:
+            list: (distance, word) tuples, closest first
+        """
+        max_distance = min(max_distance, self.max_distance)
+        candidates = set()
+        for variant in deletes(word, max_distance):
+            candidates.update(self.variants.get(variant, ()))
+
+        matches = []
+        for candidate in candidates:
+            if abs(len(candidate) - len(word)) <= max_distance:
+                distance = levenshtein(word, candidate)
+                if distance <= max_distance:
+                    matches.append((distance, candidate))
+        matches.sort()
+        return matches
+
+
+class SectionAutocomplete:
+    """
+    Prebuilt section lookup over one or more acts.
+    """
+
+    def __init__(self, act_sections):
+        """
+        Build the trie, word indexes and option lists.
+
+        Args:
+            act_sections (dict): Act name -> {section number: title}
+        """
+        self.acts = list(act_sections)
+
+        # Entry id -> (act, section, title, label)
+        self.entries = []
+        self.trie = SectionTrie()
+        # Title word -> entry ids
+        self.word_postings = {}
+        self._options = {}
+
+        for act, sections in act_sections.items():
+            options = {}
+            for section, title in sections.items():
+                label = f"Section {section}: {title}"
+                entry_id = len(self.entries)
+                self.entries.append((act, section, title, label))
+                self.trie.insert(section.lower(), entry_id)
+                for word in set(_WORD.findall(title.lower())):
+                    self.word_postings.setdefault(word, []).append(entry_id)
+                options[label] = section
+            self._options[act] = MappingProxyType(options)
+
+        self.words = sorted(self.word_postings)
+        self.word_index = SymSpellIndex(self.words)
+
+    def section_options(self, act):
+        """
+        Selectbox options for an act's section picker.
+
+        Args:
+            act (str): Act name
+
+        Returns:
+            mappingproxy: Read-only {"Section <number>: <title>": number}
+        """
+        return self._options.get(act, MappingProxyType({}))
+
+    def _word_matches(self, word):
+        """Entry id -> best score of one query word against the title words."""
+        matches = {}
+
+        def credit(entry_ids, score):
+            for entry_id in entry_ids:
+                if score > matches.get(entry_id, 0.0):
+                    matches[entry_id] = score
+
+        start = bisect.bisect_left(self.words, word)
+        for candidate in self.words[start:]:
+            if not candidate.startswith(word):
+                break
+            credit(self.word_postings[candidate], SCORE_WORD_EXACT if candidate == word else SCORE_WORD_PREFIX)
+
+        max_distance = fuzzy_distance(word)
+        if max_distance:
+            for distance, candidate in self.word_index.search(word, max_distance):
+                credit(self.word_postings[candidate], SCORE_WORD_FUZZY / distance if distance else SCORE_WORD_EXACT)
+        return matches
+
+    def lookup(self, query, act=None, limit=10):
+        """
+        Find sections by partial number or (possibly misspelt) title words.
+
+        Args:
+            query (str): E.g. "498", "420", "cheatng", "dowry death"
+            act (str, optional): Restrict results to one act
+            limit (int): Maximum number of results
+
+        Returns:
+            list: Dicts with act, section, title, label and score, best first
+        """
+        scores = {}
+        for token in _WORD.findall((query or "").lower()):
+            if token[0].isdigit():
+                matches = {entry_id: SCORE_SECTION_PREFIX for entry_id in self.trie.complete(token)}
+                matches.update((entry_id, SCORE_SECTION_EXACT) for entry_id in self.trie.exact(token))
+            else:
+                matches = self._word_matches(token)
+            for entry_id, score in matches.items():
+                scores[entry_id] = scores.get(entry_id, 0.0) + score
+
+        ranked = sorted(
+            (entry_id for entry_id in scores if act is None or self.entries[entry_id][0] == act),
+            key=lambda entry_id: (-scores[entry_id], entry_id)
+        )
+
+        results = []
+        for entry_id in ranked[:limit]:
+            entry_act, section, title, label = self.entries[entry_id]
+            results.append({
+                "act": entry_act,
+                "section": section,
+                "title": title,
+                "label": label,
+                "score": scores[entry_id]
+            })
+        return results
@@ -6,21 +6,25 @@ capabilities for legal case retrieval. Since we cannot use sentence-transformers
 we'll implement a robust alternative using our existing scikit-learn and NLTK libraries.
 """
 
-import nltk
-import numpy as np
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
-from nltk.corpus import stopwords
-from nltk.tokenize import word_tokenize, sent_tokenize
-import re
-
-# Ensure NLTK data is downloaded
-try:
-    nltk.data.find('corpora/stopwords')
-    nltk.data.find('tokenizers/punkt')
-except LookupError:
-    nltk.download('stopwords')
-    nltk.download('punkt')
+import os
+import threading
+from text_pipeline import LegalPhraseNormalizer
+from result_cache import ResultCache
+from registry import LazySingleton
+import nltk_resources
+
+# search_index, ann_index and summarizer load scikit-learn and SciPy, so they
+# are imported where they are first needed rather than at module import.
+
+# Default case index location, the same as search_index.INDEX_PATH
+INDEX_PATH = os.path.join("assets", "index", "case_index.pkl")
+
+# Legal phrases preserved as single tokens during preprocessing
+LEGAL_PHRASES = [
+    "beyond reasonable doubt", "burden of proof", "prima facie",
+    "mens rea", "actus reus", "habeas corpus", "amicus curiae",
+    "sui generis", "sine qua non", "res judicata"
+]
 
 class EnhancedLegalCaseMatcher:
     """
@@ -28,8 +32,17 @@ class EnhancedLegalCaseMatcher:
     enhanced TF-IDF with contextual weighting to improve matches.
     """
     
-    def __init__(self):
-        """Initialize the legal case matcher with enhanced TF-IDF vectorization"""
+    def __init__(self, index_path=INDEX_PATH):
+        """
+        Initialize the legal case matcher with enhanced TF-IDF vectorization
+
+        Args:
+            index_path (str, optional): Where the pre-fitted case index is
+                saved and loaded from; None keeps the index in memory only
+        """
+        from sklearn.feature_extraction.text import TfidfVectorizer
+        from summarizer import KeySentenceExtractor
+        
         # Use max_features for dimensionality reduction, ngram_range to capture phrases
         self.tfidf_vectorizer = TfidfVectorizer(
             max_features=10000,  # Increase feature count
@@ -39,8 +52,21 @@ class EnhancedLegalCaseMatcher:
             smooth_idf=True,
             sublinear_tf=True  # Apply sublinear tf scaling
         )
-        self.stop_words = set(stopwords.words('english'))
         self.legal_keywords_boost = self._load_legal_keywords()
+        self.phrase_normalizer = LegalPhraseNormalizer(LEGAL_PHRASES + list(self.legal_keywords_boost))
+        self.query_term_weights = self._query_term_weights()
+        self.index_path = index_path
+        self.case_index = None
+        self.dense_index = None
+        # Serializes changes to the case index; searches never take it
+        self._update_lock = threading.Lock()
+        self.sentence_extractor = KeySentenceExtractor(self.tfidf_vectorizer, self.preprocess_text)
+        self.result_cache = ResultCache()
+    
+    @property
+    def stop_words(self):
+        """NLTK English stopwords, loaded on first use rather than at startup."""
+        return nltk_resources.stopwords('english')
         
     def _load_legal_keywords(self):
         """
@@ -95,129 +121,408 @@ class EnhancedLegalCaseMatcher:
         """
         Enhance text preprocessing for legal documents to improve semantic matching.
         
+        Section references ("section 302" -> "section_302") and legal phrases,
+        including multi-word boost keywords, are kept together as single tokens.
+        
         Args:
             text (str): The input text to preprocess
             
         Returns:
             str: Preprocessed text optimized for legal semantic matching
         """
-        if not text:
-            return ""
-            
-        # Convert to lowercase
-        text = text.lower()
-        
-        # Replace section numbers with a standardized format 
-        # (e.g., "section 302" becomes "section_302")
-        text = re.sub(r'section\s+(\d+)', r'section_\1', text)
-        
-        # Preserve important legal phrases by replacing spaces with underscores
-        legal_phrases = [
-            "beyond reasonable doubt", "burden of proof", "prima facie",
-            "mens rea", "actus reus", "habeas corpus", "amicus curiae",
-            "sui generis", "sine qua non", "res judicata"
-        ]
-        
-        for phrase in legal_phrases:
-            if phrase in text:
-                text = text.replace(phrase, phrase.replace(" ", "_"))
-        
-        # Remove special characters while preserving underscores
-        text = re.sub(r'[^\w\s_]', ' ', text)
+        return self.phrase_normalizer.normalize(text)
+    
+    def _query_term_weights(self):
+        """
+        Map legal keywords to their boost weights in preprocessed token form.
         
-        # Remove extra whitespace
-        text = re.sub(r'\s+', ' ', text).strip()
+        Multi-word keywords are joined by the phrase normalizer, so e.g.
+        "beyond reasonable doubt" is weighted as "beyond_reasonable_doubt".
         
-        return text
+        Returns:
+            dict: Token -> query-side weight
+        """
+        return {
+            self.preprocess_text(keyword): weight
+            for keyword, weight in self.legal_keywords_boost.items()
+        }
+    
+    def _new_index(self):
+        """Create an empty case index with the legal keyword boosts attached."""
+        from search_index import LegalCaseIndex
+        index = LegalCaseIndex(self.tfidf_vectorizer)
+        index.set_term_weights(self.query_term_weights)
+        return index
+    
+    def _load_index(self):
+        """Load the case index from disk, attaching the legal keyword boosts."""
+        from search_index import LegalCaseIndex
+        index = LegalCaseIndex.load(self.index_path) if self.index_path else None
+        if index is not None:
+            index.set_term_weights(self.query_term_weights)
+        return index
     
     def enhance_query(self, query):
         """
         Enhance the query with contextual legal information.
         
+        Legal keyword boosting is applied to the vectorized query by the
+        case index (a diagonal reweighting of the query vector), so the
+        query text itself is only preprocessed.
+        
         Args:
             query (str): The original query string
             
         Returns:
             str: Enhanced query for better legal semantic matching
         """
-        # Preprocess the query
-        processed_query = self.preprocess_text(query)
+        return self.preprocess_text(query)
+    
+    def build_index(self, case_texts, case_metadata=None):
+        """
+        Build (or reuse) the pre-fitted case index for a corpus.
+        
+        The index is only refitted when the corpus fingerprint changes. When an
+        index path is configured, a matching index on disk is loaded instead
+        of refitting, and freshly built indexes are saved there.
+        
+        Args:
+            case_texts (list): List of case texts to index
+            case_metadata (list, optional): List of dictionaries containing metadata for each case
+            
+        Returns:
+            LegalCaseIndex: The index for this corpus
+        """
+        from search_index import corpus_fingerprint
+        
+        fingerprint = corpus_fingerprint(case_texts)
+        
+        if self.case_index is None and self.index_path:
+            with self._update_lock:
+                if self.case_index is None:
+                    self.case_index = self._load_index()
+        
+        index = self.case_index
+        if index is not None and index.fingerprint == fingerprint:
+            if case_metadata is None:
+                return index
+            # Metadata does not affect the vectors, so the documents are reused
+            # and only the metadata of the live rows is replaced
+            with self._update_lock:
+                index = self.case_index
+                if index.fingerprint == fingerprint:
+                    index = index.with_metadata(case_metadata)
+                    self.case_index = index
+                    return index
+        
+        index = self._new_index()
+        index.build(case_texts, [self.preprocess_text(text) for text in case_texts], case_metadata)
+        with self._update_lock:
+            if self.case_index is not None:
+                index.version = self.case_index.version + 1
+            self.case_index = index
+            self._save_index()
+        return index
+
+    def _save_index(self):
+        """Persist the current case index if an index path is configured."""
+        if self.index_path and self.case_index is not None:
+            try:
+                self.case_index.save(self.index_path)
+            except OSError as e:
+                print(f"Error saving case index: {str(e)}")
+
+    def save_index(self):
+        """
+        Persist pending incremental changes to the case index.
+
+        add_cases and remove_cases only save the index when a change triggers
+        compaction, so a batch of small changes is written once; call this
+        after a batch to keep the saved index current.
+        """
+        with self._update_lock:
+            self._save_index()
+
+    def _publish(self, index):
+        """
+        Make a changed copy of the case index the current one.
+
+        Must be called with the update lock held. Searches already running
+        keep the index they started with; later searches see the new one.
+        The index is saved when the change compacted it.
+        """
+        self.case_index = index
+        if index.pending_changes == 0:
+            self._save_index()
+
+    def add_cases(self, case_texts, case_metadata=None):
+        """
+        Incrementally add cases to the index without a full re-vectorization.
+
+        The cases are added to a copy of the index, which then replaces the
+        current one, so concurrent searches never see a half-updated index.
+
+        Args:
+            case_texts (list): Texts of the new cases (e.g. newly ingested judgments)
+            case_metadata (list, optional): List of dictionaries containing metadata for each case
+
+        Returns:
+            list: Document ids assigned to the new cases, usable with remove_cases
+        """
+        processed_texts = [self.preprocess_text(text) for text in case_texts]
+
+        with self._update_lock:
+            index = self.case_index
+            if index is None and self.index_path:
+                index = self._load_index()
+            index = index.copy() if index is not None else self._new_index()
+
+            doc_ids = index.add(case_texts, processed_texts, case_metadata)
+            self._publish(index)
+        return doc_ids
+
+    def remove_cases(self, doc_ids):
+        """
+        Remove cases from the index; they are tombstoned until the next compaction.
+
+        Args:
+            doc_ids (list): Document ids returned by add_cases
+
+        Returns:
+            int: Number of cases removed
+        """
+        with self._update_lock:
+            if self.case_index is None:
+                return 0
+
+            index = self.case_index.copy()
+            removed = index.remove(doc_ids)
+            if removed:
+                self._publish(index)
+        return removed
+
+    def compact_index(self):
+        """Drop removed cases and refresh IDF statistics of the case index."""
+        with self._update_lock:
+            if self.case_index is None:
+                return
+
+            index = self.case_index.copy()
+            index.compact()
+            self._publish(index)
+
+    def build_dense_index(self, n_components=192, method="svd", n_lists=None, n_probe=8):
+        """
+        Build the approximate (dense embedding) index for the current case index.
         
-        # Split into tokens
-        tokens = processed_query.split()
+        Args:
+            n_components (int): Embedding dimension, typically 128-256
+            method (str): "svd" for LSA or "random_projection"
+            n_lists (int, optional): Number of IVF partitions
+            n_probe (int): Partitions scanned per query (recall vs latency knob)
+            
+        Returns:
+            DenseEmbeddingIndex: The dense index, or None if no case index exists
+        """
+        with self._update_lock:
+            index = self.case_index
+            if index is None or index.doc_matrix is None:
+                return None
+            
+            self.dense_index = self._build_dense_index(index, n_components, method, n_lists, n_probe)
+            return self.dense_index
+    
+    def _build_dense_index(self, index, n_components=192, method="svd", n_lists=None, n_probe=8):
+        """Build a dense index from a case index; see build_dense_index."""
+        from ann_index import DenseEmbeddingIndex, EMBEDDINGS_PATH
         
-        # Apply keyword boosting by duplicating important legal terms
-        enhanced_tokens = []
-        for token in tokens:
-            enhanced_tokens.append(token)
+        embeddings_path = (
+            os.path.join(os.path.dirname(self.index_path), os.path.basename(EMBEDDINGS_PATH))
+            if self.index_path else None
+        )
+        return DenseEmbeddingIndex(
+            n_components=n_components,
+            method=method,
+            n_lists=n_lists,
+            n_probe=n_probe,
+            embeddings_path=embeddings_path
+        ).build(index)
+    
+    def _dense_index_for(self, index):
+        """
+        Get a dense index matching the case index a query is using.
+        
+        Added and removed cases are folded into the existing dense index;
+        only a refitted case index (e.g. after compaction) is rebuilt. Both
+        happen under the update lock, from the query's own case index, and
+        the result is shared only if that index is still the current one.
+        """
+        dense = self.dense_index
+        if dense is not None and dense.source_version == index.version:
+            return dense
+        
+        with self._update_lock:
+            dense = self.dense_index
+            if dense is not None and dense.source_version == index.version:
+                return dense
             
-            # If token is a legal keyword, add it again to boost its weight
-            if token in self.legal_keywords_boost:
-                boost_factor = int(self.legal_keywords_boost[token])
-                for _ in range(boost_factor - 1):
-                    enhanced_tokens.append(token)
+            updated = dense.update(index) if dense is not None else None
+            if updated is None:
+                config = (dense.n_components, dense.method, dense.n_lists, dense.n_probe) if dense else ()
+                updated = self._build_dense_index(index, *config)
+            if self.case_index is None or index.version >= self.case_index.version:
+                self.dense_index = updated
+            return updated
+    
+    def _search_dense(self, index, enhanced_query, top_k, min_score):
+        """Search the dense index, bringing it up to date with the case index first."""
+        if index.doc_matrix is None or index.size == 0:
+            return []
+        dense = self._dense_index_for(index)
+        return dense.search(index.transform(enhanced_query), top_k, min_score=min_score)
+    
+    def _format_results(self, index, matches):
+        """
+        Convert (document index, similarity) pairs into result dictionaries.
         
-        return ' '.join(enhanced_tokens)
+        Args:
+            index (LegalCaseIndex): The index the matches came from
+            matches (list): (document index, similarity) tuples
+            
+        Returns:
+            list: Matching cases with similarity scores and metadata
+        """
+        results = []
+        for idx, similarity in matches:
+            if similarity > 0:  # Only include if there's some similarity
+                case_result = {
+                    'text': index.case_texts[idx],
+                    'similarity': similarity
+                }
+                
+                # Add metadata if available
+                if index.case_metadata and idx < len(index.case_metadata):
+                    case_result.update(index.case_metadata[idx])
+                
+                results.append(case_result)
+        
+        return results
     
-    def find_similar_cases(self, query, case_texts, case_metadata=None, top_k=5):
+    def find_similar_cases(self, query, case_texts=None, case_metadata=None, top_k=5, min_score=0.0,
+                           approximate=False):
         """
         Find similar cases using enhanced semantic search.
         
+        The corpus is vectorized once into a pre-fitted index; subsequent
+        queries against the same corpus only transform the query.
+        
         Args:
             query (str): The query text describing the case scenario
-            case_texts (list): List of case texts to search within
+            case_texts (list, optional): List of case texts to search within;
+                if omitted, the most recently built index is searched
             case_metadata (list, optional): List of dictionaries containing metadata for each case
             top_k (int): Number of top matches to return
+            min_score (float): Only cases with similarity above this score are returned
+            approximate (bool): Use the dense embedding ANN index instead of
+                exact sparse scoring; faster on large corpora at some recall cost
             
         Returns:
             list: Top matching cases with similarity scores
         """
-        if not case_texts:
+        if case_texts is not None and not case_texts:
+            return []
+        if case_texts is None and self.case_index is None:
             return []
             
         # Enhance the query for better matching
         enhanced_query = self.enhance_query(query)
         
-        # Create corpus by combining case texts with the query
-        corpus = [self.preprocess_text(text) for text in case_texts]
-        corpus.append(enhanced_query)
-        
-        # Vectorize the corpus
         try:
-            tfidf_matrix = self.tfidf_vectorizer.fit_transform(corpus)
-            
-            # Calculate similarity between query and all cases
-            query_idx = len(corpus) - 1
-            similarities = cosine_similarity(tfidf_matrix[query_idx], tfidf_matrix[:-1])[0]
-            
-            # Get indices of top-k matches
-            top_indices = similarities.argsort()[-top_k:][::-1]
-            
-            # Prepare results with metadata if available
-            results = []
-            for idx in top_indices:
-                if similarities[idx] > 0:  # Only include if there's some similarity
-                    case_result = {
-                        'text': case_texts[idx],
-                        'similarity': float(similarities[idx])
-                    }
-                    
-                    # Add metadata if available
-                    if case_metadata and idx < len(case_metadata):
-                        case_result.update(case_metadata[idx])
-                    
-                    results.append(case_result)
-            
-            return results
+            if case_texts is None:
+                index = self.case_index
+            else:
+                index = self.build_index(case_texts, case_metadata)
+            
+            # Matches (not formatted results) are cached, so metadata refreshed
+            # in place on the index is always reflected in the output
+            dense = self.dense_index
+            dense_config = (dense.n_components, dense.method, dense.n_lists, dense.n_probe) if approximate and dense else None
+            cache_key = (
+                "cases", enhanced_query, top_k, min_score, approximate, dense_config,
+                index.fingerprint, index.version
+            )
+            matches = self.result_cache.get(cache_key)
+            if matches is None:
+                if approximate:
+                    matches = self._search_dense(index, enhanced_query, top_k, min_score)
+                else:
+                    matches = index.search(enhanced_query, top_k, min_score=min_score)
+                self.result_cache.put(cache_key, matches)
+            
+            return self._format_results(index, matches)
         except Exception as e:
             print(f"Error in finding similar cases: {str(e)}")
             # Fallback to basic matching if vectorization fails
+            case_texts = case_texts if case_texts is not None else self.case_index.case_texts
             return [{'text': text, 'similarity': 0.5} for text in case_texts[:min(top_k, len(case_texts))]]
     
+    def find_similar_cases_batch(self, queries, case_texts=None, case_metadata=None, top_k=5, min_score=0.0):
+        """
+        Find similar cases for several queries in one pass.
+        
+        All queries are vectorized together and scored against the index
+        with a single sparse matrix product.
+        
+        Args:
+            queries (list): Query texts describing case scenarios
+            case_texts (list, optional): List of case texts to search within;
+                if omitted, the most recently built index is searched
+            case_metadata (list, optional): List of dictionaries containing metadata for each case
+            top_k (int): Number of top matches to return per query
+            min_score (float): Only cases with similarity above this score are returned
+            
+        Returns:
+            list: One list of top matching cases per query, in query order
+        """
+        if not queries:
+            return []
+        if (case_texts is not None and not case_texts) or (case_texts is None and self.case_index is None):
+            return [[] for _ in queries]
+        
+        enhanced_queries = [self.enhance_query(query) for query in queries]
+        
+        try:
+            if case_texts is None:
+                index = self.case_index
+            else:
+                index = self.build_index(case_texts, case_metadata)
+            
+            return [
+                self._format_results(index, matches)
+                for matches in index.search_batch(enhanced_queries, top_k, min_score=min_score)
+            ]
+        except Exception as e:
+            print(f"Error in finding similar cases: {str(e)}")
+            case_texts = case_texts if case_texts is not None else self.case_index.case_texts
+            fallback = [{'text': text, 'similarity': 0.5} for text in case_texts[:min(top_k, len(case_texts))]]
+            return [list(fallback) for _ in queries]
+    
+    def cache_stats(self):
+        """
+        Report hit/miss statistics of the search result cache.
+        
+        Returns:
+            dict: Cache counters and size
+        """
+        return self.result_cache.stats()
+    
     def extract_key_sentences(self, text, top_n=3):
         """
         Extract the most important sentences from a legal text.
         
+        Uses a per-call vectorizer, so it never modifies the shared
+        matcher state and is safe to call from concurrent sessions.
+        
         Args:
             text (str): The legal text to analyze
             top_n (int): Number of key sentences to extract
@@ -225,27 +530,7 @@ class EnhancedLegalCaseMatcher:
         Returns:
             list: Key sentences extracted from the text
         """
-        # Split text into sentences
-        sentences = sent_tokenize(text)
-        if len(sentences) <= top_n:
-            return sentences
-            
-        # Preprocess sentences
-        preprocessed_sentences = [self.preprocess_text(s) for s in sentences]
-        
-        # Create sentence vectors
-        sentence_vectors = self.tfidf_vectorizer.fit_transform(preprocessed_sentences)
-        
-        # Calculate sentence importance using centrality
-        similarity_matrix = cosine_similarity(sentence_vectors)
-        scores = np.sum(similarity_matrix, axis=1)
-        
-        # Get indices of top sentences
-        top_indices = scores.argsort()[-top_n:][::-1]
-        
-        # Return original sentences in document order
-        sorted_indices = sorted(top_indices)
-        return [sentences[idx] for idx in sorted_indices]
+        return self.sentence_extractor.extract(text, top_n)
 
-# Create a singleton instance
-legal_case_matcher = EnhancedLegalCaseMatcher()
\ No newline at end of file
+# The case matcher is built on first use (or by registry.prewarm)
+legal_case_matcher = LazySingleton("legal_case_matcher", EnhancedLegalCaseMatcher)
\ No newline at end of file
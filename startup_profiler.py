@@ -0,0 +1,277 @@
+"""
+Startup-time profiler for the Streamlit app and its pages.
+
+Each target is imported in its own fresh interpreter with ``-X importtime``,
+so modules already loaded by one page never hide the cost of another. The
+per-module timings are rebuilt into an import tree, heavy imports are flagged
+(marked "deferrable" when the page imports them at top level and could move
+them into the function that uses them), and targets that exceed the time
+budget fail the run.
+
+Usage:
+    python startup_profiler.py [TARGET ...] [--budget-ms MS] [--heavy-ms MS]
+                               [--min-ms MS] [--depth N] [--imports-only]
+
+Without targets, app.py and every page in pages/ are profiled. The budget
+can also be set with the STARTUP_BUDGET_MS environment variable. The exit
+status is 1 if any target is over budget or fails to import.
+"""
+
+import argparse
+import ast
+import glob
+import json
+import os
+import subprocess
+import sys
+
+ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Default cold start budget per target in milliseconds
+DEFAULT_BUDGET_MS = float(os.environ.get("STARTUP_BUDGET_MS", 2000))
+
+# Top-level imports at least this slow are flagged as heavy
+DEFAULT_HEAVY_MS = 100.0
+
+# Tree nodes faster than this are not printed
+DEFAULT_MIN_MS = 5.0
+
+# Runs in the child interpreter: executes the target (or only its top-level
+# imports) and reports wall time and any error as one JSON line on stdout
+_CHILD_SCRIPT = """
+import ast, json, runpy, sys, time, traceback
+root, path, imports_only = sys.argv[1], sys.argv[2], sys.argv[3] == "1"
+sys.path.insert(0, root)
+sys.stderr.write("__STARTUP_PROFILE_BEGIN__\\n")
+sys.stderr.flush()
+start = time.perf_counter()
+error = None
+try:
+    if imports_only:
+        with open(path, "r", encoding="utf-8") as f:
+            tree = ast.parse(f.read(), path)
+        body = [node for node in tree.body if isinstance(node, (ast.Import, ast.ImportFrom))]
+        exec(compile(ast.Module(body=body, type_ignores=[]), path, "exec"), {"__name__": "__page__"})
+    else:
+        runpy.run_path(path, run_name="__page__")
+except BaseException as e:
+    error = traceback.format_exception_only(type(e), e)[-1].strip()
+print("__STARTUP_PROFILE__" + json.dumps({"wall_ms": (time.perf_counter() - start) * 1000, "error": error}))
+"""
+
+
+class ImportNode:
+    """
+    One module in an import tree, with its own and cumulative import time.
+    """
+
+    def __init__(self, name, self_ms, cumulative_ms):
+        self.name = name
+        self.self_ms = self_ms
+        self.cumulative_ms = cumulative_ms
+        self.children = []
+
+    def to_dict(self):
+        return {
+            "name": self.name,
+            "self_ms": self.self_ms,
+            "cumulative_ms": self.cumulative_ms,
+            "children": [child.to_dict() for child in self.children]
+        }
+
+
+def parse_importtime(output):
+    """
+    Rebuild the import tree from ``-X importtime`` output.
+
+    The interpreter prints a module after all of its imports, indented two
+    spaces per level, so each line adopts the pending nodes one level deeper.
+    Imports made by interpreter startup and the profiler itself, before the
+    begin marker, are skipped.
+
+    Args:
+        output (str): The child's stderr
+
+    Returns:
+        list: Root ImportNode objects in import order
+    """
+    lines = output.splitlines()
+    if "__STARTUP_PROFILE_BEGIN__" in lines:
+        lines = lines[lines.index("__STARTUP_PROFILE_BEGIN__") + 1:]
+
+    pending = {}
+    for line in lines:
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        fields = line[len("import time:"):].split("|")
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue  # Header line
+
+        name_field = fields[2]
+        stripped = name_field.lstrip(" ")
+        level = (len(name_field) - len(stripped) - 1) // 2
+
+        node = ImportNode(stripped.strip(), int(fields[0]) / 1000, int(fields[1]) / 1000)
+        node.children = pending.pop(level + 1, [])
+        pending.setdefault(level, []).append(node)
+
+    return pending.get(0, [])
+
+
+def top_level_imports(path):
+    """
+    Return the root package names a script imports at module level.
+
+    Args:
+        path (str): Path of the script
+
+    Returns:
+        set: Package names, e.g. {"streamlit", "pandas"}
+    """
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            tree = ast.parse(f.read(), path)
+    except (OSError, SyntaxError):
+        return set()
+
+    names = set()
+    for node in tree.body:
+        if isinstance(node, ast.Import):
+            names.update(alias.name.split(".")[0] for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+            names.add(node.module.split(".")[0])
+    return names
+
+
+def profile_target(path, imports_only=False):
+    """
+    Import one target in a fresh interpreter and collect its import tree.
+
+    Args:
+        path (str): Script to profile
+        imports_only (bool): Only execute the script's top-level imports
+            instead of the whole page
+
+    Returns:
+        dict: Target, wall time, import time, error and root ImportNodes
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", _CHILD_SCRIPT, ROOT_DIR, path, "1" if imports_only else "0"],
+        cwd=ROOT_DIR,
+        capture_output=True,
+        text=True
+    )
+
+    summary = {"wall_ms": None, "error": f"Profiler child exited with status {result.returncode}"}
+    for line in result.stdout.splitlines():
+        if line.startswith("__STARTUP_PROFILE__"):
+            summary = json.loads(line[len("__STARTUP_PROFILE__"):])
+
+    roots = parse_importtime(result.stderr)
+    return {
+        "target": os.path.relpath(path, ROOT_DIR),
+        "wall_ms": summary["wall_ms"],
+        "import_ms": sum(root.cumulative_ms for root in roots),
+        "error": summary["error"],
+        "roots": roots
+    }
+
+
+def heavy_imports(profile, path, heavy_ms=DEFAULT_HEAVY_MS):
+    """
+    List the slow top-level imports of a profiled target.
+
+    Args:
+        profile (dict): Result of profile_target
+        path (str): Script that was profiled
+        heavy_ms (float): Cumulative time at which an import counts as heavy
+
+    Returns:
+        list: (module, cumulative ms, deferrable) tuples, slowest first;
+            deferrable means the script itself imports it at top level
+    """
+    direct = top_level_imports(path)
+    heavy = [
+        (root.name, root.cumulative_ms, root.name.split(".")[0] in direct)
+        for root in profile["roots"]
+        if root.cumulative_ms >= heavy_ms
+    ]
+    heavy.sort(key=lambda item: item[1], reverse=True)
+    return heavy
+
+
+def _print_tree(nodes, depth, min_ms, indent=1):
+    """Print import tree nodes above min_ms, down to the given depth."""
+    if depth <= 0:
+        return
+    for node in sorted(nodes, key=lambda n: n.cumulative_ms, reverse=True):
+        if node.cumulative_ms < min_ms:
+            continue
+        print(f"{'  ' * indent}{node.name:<{48 - 2 * indent}} {node.cumulative_ms:9.1f} ms (self {node.self_ms:.1f})")
+        _print_tree(node.children, depth - 1, min_ms, indent + 1)
+
+
+def default_targets():
+    """app.py followed by every Streamlit page."""
+    return [os.path.join(ROOT_DIR, "app.py")] + sorted(glob.glob(os.path.join(ROOT_DIR, "pages", "*.py")))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Per-page startup import profiler")
+    parser.add_argument("targets", nargs="*", help="Scripts to profile (default: app.py and pages/*.py)")
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS, help="Cold start budget per target")
+    parser.add_argument("--heavy-ms", type=float, default=DEFAULT_HEAVY_MS, help="Flag imports slower than this")
+    parser.add_argument("--min-ms", type=float, default=DEFAULT_MIN_MS, help="Hide tree nodes faster than this")
+    parser.add_argument("--depth", type=int, default=2, help="Import tree depth to print")
+    parser.add_argument("--imports-only", action="store_true", help="Only run each script's top-level imports")
+    parser.add_argument("--json", action="store_true", help="Print the full report as JSON")
+
+    args = parser.parse_args()
+    targets = [os.path.abspath(target) for target in args.targets] or default_targets()
+
+    report = []
+    failed = False
+    for path in targets:
+        profile = profile_target(path, imports_only=args.imports_only)
+        heavy = heavy_imports(profile, path, args.heavy_ms)
+        total_ms = profile["wall_ms"] if profile["wall_ms"] is not None else profile["import_ms"]
+        over_budget = total_ms > args.budget_ms
+        failed = failed or over_budget or profile["error"] is not None
+
+        report.append({
+            "target": profile["target"],
+            "wall_ms": profile["wall_ms"],
+            "import_ms": profile["import_ms"],
+            "over_budget": over_budget,
+            "error": profile["error"],
+            "heavy_imports": [
+                {"module": name, "cumulative_ms": ms, "deferrable": deferrable}
+                for name, ms, deferrable in heavy
+            ],
+            "tree": [root.to_dict() for root in profile["roots"]]
+        })
+
+        if args.json:
+            continue
+
+        status = "OVER BUDGET" if over_budget else "ok"
+        print(f"{profile['target']}: {total_ms:.1f} ms total, {profile['import_ms']:.1f} ms importing [{status}]")
+        if profile["error"]:
+            print(f"  error: {profile['error']}")
+        _print_tree(profile["roots"], args.depth, args.min_ms)
+        for name, ms, deferrable in heavy:
+            hint = " (deferrable: imported at top level)" if deferrable else ""
+            print(f"  heavy: {name} {ms:.1f} ms{hint}")
+        print()
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        over = [entry["target"] for entry in report if entry["over_budget"]]
+        print(f"{len(report)} targets profiled, budget {args.budget_ms:.0f} ms, {len(over)} over budget")
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
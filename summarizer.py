@@ -0,0 +1,77 @@
+"""
+Extractive summarization for legal texts.
+
+Sentences are ranked by centrality: the sum of their cosine similarities to
+every other sentence. Because sentence vectors are L2-normalized, that row
+sum of the Gram matrix X X^T equals X (X^T 1), so it is computed from the
+sparse matrix directly in O(nnz) without materializing the n x n matrix.
+
+Each call fits a fresh clone of the template vectorizer, so concurrent
+callers (e.g. Streamlit sessions sharing one matcher) never share or
+overwrite fitted state.
+"""
+
+import numpy as np
+from sklearn.base import clone
+
+from nltk_resources import sent_tokenize
+from search_index import top_k_indices
+
+
+class KeySentenceExtractor:
+    """
+    A stateless, thread-safe key sentence extractor.
+    """
+
+    def __init__(self, vectorizer, preprocess=None):
+        """
+        Initialize the extractor.
+
+        Args:
+            vectorizer (TfidfVectorizer): Template vectorizer; it is cloned
+                for every call and never fitted itself
+            preprocess (callable, optional): Text preprocessing applied to each sentence
+        """
+        self.vectorizer = vectorizer
+        self.preprocess = preprocess
+
+    def sentence_scores(self, sentences):
+        """
+        Compute the centrality score of each sentence.
+
+        Args:
+            sentences (list): Sentences of a single document
+
+        Returns:
+            numpy.ndarray: Centrality score per sentence
+        """
+        if self.preprocess is not None:
+            sentences = [self.preprocess(s) for s in sentences]
+
+        sentence_vectors = clone(self.vectorizer).fit_transform(sentences)
+        column_sums = np.asarray(sentence_vectors.sum(axis=0)).ravel()
+        return np.asarray(sentence_vectors @ column_sums).ravel()
+
+    def extract(self, text, top_n=3):
+        """
+        Extract the most important sentences from a text.
+
+        Args:
+            text (str): The text to analyze
+            top_n (int): Number of key sentences to extract
+
+        Returns:
+            list: Key sentences in document order
+        """
+        sentences = sent_tokenize(text)
+        if len(sentences) <= top_n:
+            return sentences
+
+        try:
+            scores = self.sentence_scores(sentences)
+        except ValueError:
+            # Every sentence was empty after preprocessing/stopword removal
+            return sentences[:top_n]
+
+        top_indices = top_k_indices(scores, top_n)
+        return [sentences[idx] for idx in sorted(top_indices)]
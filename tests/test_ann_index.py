@@ -0,0 +1,78 @@
+import random
+
+import numpy as np
+import pytest
+from sklearn.feature_extraction.text import TfidfVectorizer
+
+from ann_index import DenseEmbeddingIndex
+from search_index import LegalCaseIndex
+
+WORDS = ["murder", "theft", "bail", "custody", "evidence", "witness", "appeal", "fraud",
+         "dowry", "cheating", "petition", "writ", "forgery", "bribery", "negligence"]
+
+
+def build_case_index(n_docs):
+    rng = random.Random(0)
+    texts = [" ".join(rng.choice(WORDS) for _ in range(20)) + f" case{i}" for i in range(n_docs)]
+    return LegalCaseIndex(TfidfVectorizer()).build(texts, texts)
+
+
+@pytest.mark.parametrize("method", ["svd", "random_projection"])
+@pytest.mark.parametrize("n_docs", [3, 500])
+def test_build_and_search(method, n_docs, tmp_path):
+    case_index = build_case_index(n_docs)
+    dense = DenseEmbeddingIndex(
+        n_components=16, method=method, embeddings_path=str(tmp_path / "embeddings.npy")
+    ).build(case_index)
+
+    assert dense.embeddings.dtype == np.float32
+    assert np.allclose(np.linalg.norm(dense.embeddings, axis=1), 1.0, atol=1e-5)
+
+    query = case_index.case_texts[1]
+    results = dense.search(case_index.transform(query), top_k=3, n_probe=len(dense.centroids))
+    assert results
+    assert results[0][0] == 1
+    assert results[0][1] == pytest.approx(1.0, abs=1e-5)
+
+
+def test_rebuild_keeps_previous_embeddings_readable(tmp_path):
+    path = str(tmp_path / "embeddings.npy")
+    first = DenseEmbeddingIndex(n_components=8, embeddings_path=path).build(build_case_index(50))
+    before = np.array(first.embeddings)
+
+    DenseEmbeddingIndex(n_components=8, embeddings_path=path).build(build_case_index(80))
+
+    # The earlier mapping still sees its own file, not the rebuilt one
+    assert np.array_equal(np.asarray(first.embeddings), before)
+    assert not list(tmp_path.glob("*.tmp"))
+
+
+def test_update_follows_added_and_removed_documents(tmp_path):
+    case_index = build_case_index(200)
+    dense = DenseEmbeddingIndex(n_components=16, embeddings_path=str(tmp_path / "embeddings.npy")).build(case_index)
+
+    updated_index = case_index.copy()
+    updated_index.refresh_threshold = 1.0
+    new_ids = updated_index.add(["dowry dowry cheating writ"], ["dowry dowry cheating writ"])
+    updated_index.remove([1])
+    updated = dense.update(updated_index)
+
+    assert updated is not None
+    assert updated.embeddings is dense.embeddings
+    assert dense.delta_vectors is None
+
+    n_probe = len(updated.centroids)
+    results = updated.search(updated_index.transform("dowry dowry cheating writ"), top_k=1, n_probe=n_probe)
+    assert results[0][0] == updated_index._rows_by_id[new_ids[0]]
+    removed = updated.search(updated_index.transform(case_index.case_texts[1]), top_k=200, n_probe=n_probe)
+    assert 1 not in {row for row, _ in removed}
+
+
+def test_update_requires_rebuild_after_refit(tmp_path):
+    case_index = build_case_index(50)
+    dense = DenseEmbeddingIndex(n_components=8, embeddings_path=None).build(case_index)
+
+    refitted = case_index.copy()
+    refitted.compact()
+
+    assert dense.update(refitted) is None
@@ -0,0 +1,44 @@
+import json
+import os
+import subprocess
+import sys
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SCRIPT = """
+import json
+from sklearn.feature_extraction.text import ENGLISH_STOP_WORDS
+from text_pipeline import legal_text_pipeline
+from model import legal_predictor
+
+precedents = legal_predictor.find_similar_precedents("murder with intention", "302", "IPC")
+defense = legal_predictor.suggest_defense_options("302", "IPC", "acted in self defence")
+
+print(json.dumps({
+    "preprocessed": legal_text_pipeline.preprocess("The accused was arrested under Section 302"),
+    "builtin_stop_words": legal_text_pipeline.stop_words == frozenset(ENGLISH_STOP_WORDS),
+    "rights": len(legal_predictor.predict_rights("302", "IPC", "The accused was arrested")["rights"]),
+    "precedents": len(precedents.get("precedents", [])),
+    "precedent_problems": sorted(set(precedents) & {"error", "note"}),
+    "defense_options": len(defense.get("defense_options", [])),
+    "defense_problems": sorted(set(defense) & {"error", "note"})
+}))
+"""
+
+
+def test_text_pipeline_and_predictor_work_offline_without_nltk_data(tmp_path):
+    env = dict(os.environ, NLTK_OFFLINE="1", NLTK_VENDOR_DIR=str(tmp_path), PYTHONPATH=REPO_DIR)
+    completed = subprocess.run(
+        [sys.executable, "-c", SCRIPT], cwd=REPO_DIR, env=env,
+        capture_output=True, text=True, timeout=300
+    )
+    assert completed.returncode == 0, completed.stderr
+
+    result = json.loads(completed.stdout.strip().splitlines()[-1])
+    assert result["preprocessed"] == "accused arrested section"
+    assert result["builtin_stop_words"]
+    assert result["rights"] > 0
+    assert result["precedents"] > 0
+    assert result["precedent_problems"] == []
+    assert result["defense_options"] > 0
+    assert result["defense_problems"] == []
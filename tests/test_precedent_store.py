@@ -0,0 +1,38 @@
+from legal_data_index import LegalDataIndex
+from precedent_store import PrecedentStore
+from search_index import PrecedentIndex
+
+PRECEDENTS = [
+    {"case_name": "A v State", "citation": "1", "act": "IPC", "section": "302",
+     "summary": "murder conviction upheld on eyewitness evidence", "key_points": ["eyewitness evidence"]},
+    {"case_name": "B v State", "citation": "2", "act": "IPC", "section": "30, 420",
+     "summary": "cheating by false promise of refund", "key_points": ["dishonest intention"]},
+]
+ADDED = {"case_name": "C v State", "citation": "3", "act": "IPC", "section": "302",
+         "summary": "murder acquittal as eyewitness evidence was unreliable", "key_points": ["eyewitness evidence"]}
+
+
+def test_section_lookup_is_exact_and_shared():
+    store = PrecedentStore(PRECEDENTS)
+
+    assert [p["case_name"] for p in store.for_section("30")] == ["B v State"]
+    assert store.for_section("302") is store.for_section("302")
+    assert isinstance(store.for_section("420")[0]["key_points"], tuple)
+
+
+def test_indexes_pick_up_added_precedents():
+    store = PrecedentStore(PRECEDENTS)
+    precedent_index = PrecedentIndex(store)
+    data_index = LegalDataIndex({}, store)
+    precedent_index.search("eyewitness evidence", "302", "IPC")
+    data_index.search("acquittal")
+
+    store.add(ADDED)
+
+    ranked = precedent_index.search("eyewitness evidence", "302", "IPC")
+    assert {p["case_name"] for p, _ in ranked} == {"A v State", "C v State"}
+    results = data_index.search("acquittal")["Precedents"]
+    assert [p["case_name"] for p in results] == ["C v State"]
+    # Results are plain copies of the read-only records
+    results[0]["key_points"].append("edited")
+    assert store.precedents[-1]["key_points"] == ("eyewitness evidence",)
@@ -0,0 +1,45 @@
+from semantic_search import EnhancedLegalCaseMatcher
+
+TEXTS = ["alpha murder knife", "beta theft phone", "gamma fraud bank", "delta dowry death",
+         "eps cheating cheque", "zeta bail custody", "eta writ petition"]
+METADATA = [{"name": text.split()[0]} for text in TEXTS]
+
+
+def test_metadata_follows_live_rows_after_removal():
+    matcher = EnhancedLegalCaseMatcher(index_path=None)
+    matcher.build_index(TEXTS, METADATA)
+    matcher.remove_cases([0])
+
+    results = matcher.find_similar_cases("fraud bank", TEXTS[1:], METADATA[1:], top_k=1)
+
+    assert [(result["text"], result["name"]) for result in results] == [("gamma fraud bank", "gamma")]
+
+
+def test_fingerprint_tracks_adds_and_removes():
+    matcher = EnhancedLegalCaseMatcher(index_path=None)
+    matcher.build_index(TEXTS)
+    doc_ids = matcher.add_cases(["theta fraud bank loan"])
+    matcher.remove_cases([1])
+
+    live = TEXTS[:1] + TEXTS[2:] + ["theta fraud bank loan"]
+    assert matcher.case_index.live_texts() == live
+    version = matcher.case_index.version
+    # The live corpus matches the index, so it is reused rather than refitted
+    assert matcher.build_index(live).version == version
+    assert doc_ids == [len(TEXTS)]
+
+
+def test_approximate_search_folds_in_added_cases():
+    matcher = EnhancedLegalCaseMatcher(index_path=None)
+    texts = [f"{word} case {i}" for i in range(40) for word in ("murder", "theft", "fraud")]
+    matcher.build_index(texts)
+    matcher.find_similar_cases("murder", top_k=1, approximate=True)
+    embeddings = matcher.dense_index.embeddings
+
+    # Only words already in the vocabulary are searchable before compaction
+    matcher.add_cases(["murder theft fraud"])
+    results = matcher.find_similar_cases("murder theft fraud", top_k=1, approximate=True)
+
+    assert results[0]["text"] == "murder theft fraud"
+    # Added cases are projected into the existing embeddings, not rebuilt
+    assert matcher.dense_index.embeddings is embeddings
@@ -0,0 +1,218 @@
+"""
+Shared text normalization for legal documents.
+
+LegalPhraseNormalizer folds punctuation and whitespace with C-level string
+operations and then makes a single pass of one compiled regex that joins
+"section <number>" references and multi-word legal phrases into single
+underscore tokens (e.g. "mens rea" -> "mens_rea"). The phrase alternation is
+compiled as a character trie, so each candidate position is rejected after
+one character unless it starts a known phrase.
+
+TextPipeline is the general-purpose preprocessing used by the predictor and
+utility helpers: lowercase, strip punctuation and digits, tokenize and drop
+stopwords, with results memoized per input string.
+"""
+
+import functools
+import re
+import string
+import threading
+
+# ASCII punctuation becomes whitespace; underscores are kept because they
+# join phrase tokens
+_PUNCTUATION_TABLE = str.maketrans({char: " " for char in string.punctuation if char != "_"})
+
+# Catches non-ASCII punctuation and symbols that the translate table misses
+_NON_WORD = re.compile(r"[^\w\s]")
+
+
+def _fold(text):
+    """Lowercase text, strip punctuation and collapse whitespace to single spaces."""
+    text = text.lower().translate(_PUNCTUATION_TABLE)
+    if not text.isascii():
+        text = _NON_WORD.sub(" ", text)
+    return " ".join(text.split())
+
+
+def _trie_pattern(phrases):
+    """
+    Build a regex alternation for phrases, factored as a character trie.
+
+    Args:
+        phrases (list): Normalized phrases (lowercase, single spaces)
+
+    Returns:
+        str: Regex source matching any of the phrases
+    """
+    trie = {}
+    for phrase in phrases:
+        node = trie
+        for char in phrase:
+            node = node.setdefault(char, {})
+        node[""] = True
+
+    def build(node):
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        # A phrase may end here and also continue into a longer one
+        return "(?:" + body + ")?" if "" in node else body
+
+    return build(trie)
+
+
+class LegalPhraseNormalizer:
+    """
+    A compiled, single-pass normalizer for legal text.
+    """
+
+    def __init__(self, phrases):
+        """
+        Compile the normalizer for a set of multi-word phrases.
+
+        Args:
+            phrases (list): Legal phrases to keep together as single tokens;
+                they are normalized the same way as input text, so
+                "non-bailable" and "non bailable" are equivalent
+        """
+        normalized = {_fold(phrase) for phrase in phrases}
+        self.phrases = sorted(phrase for phrase in normalized if " " in phrase)
+
+        # Every match starts with the space before a word, which gives the
+        # regex engine a literal prefix to scan for
+        alternatives = [r"section (?=\d)"]
+        if self.phrases:
+            alternatives.append(r"(?:" + _trie_pattern(self.phrases) + r")(?= )")
+        self.pattern = re.compile(r" (?:" + "|".join(alternatives) + r")")
+
+    @staticmethod
+    def _join(match):
+        """Replace inner spaces of a matched phrase with underscores."""
+        matched = match.group(0)
+        return " " + matched[1:].replace(" ", "_")
+
+    def normalize(self, text):
+        """
+        Normalize text for legal semantic matching.
+
+        Args:
+            text (str): The input text
+
+        Returns:
+            str: Lowercased text with punctuation removed, single spaces, and
+                section references and legal phrases joined with underscores
+        """
+        if not text:
+            return ""
+
+        # Pad with spaces so phrases at either end match like any other
+        padded = " " + _fold(text) + " "
+        return self.pattern.sub(self._join, padded).strip()
+
+
+# Punctuation and digits are dropped outright (not replaced with spaces),
+# matching the original preprocess_text behaviour
+_STRIP_CHARS = re.compile(r"[^\w\s]+|\d+")
+
+# Default number of memoized preprocessing results
+PREPROCESS_CACHE_SIZE = 4096
+
+
+class TextPipeline:
+    """
+    Reusable NLP preprocessing: lowercase, strip punctuation and digits,
+    tokenize and remove stopwords.
+
+    The stopword set is loaded once and frozen, the regexes are compiled once,
+    and tokenization is a whitespace split (punctuation is already gone, so
+    this gives the same tokens as NLTK's word_tokenize without the cost).
+    Results are memoized per input string, so repeated preprocessing of the
+    same description within a request is free.
+    """
+
+    def __init__(self, language="english", cache_size=PREPROCESS_CACHE_SIZE):
+        """
+        Initialize the pipeline.
+
+        Args:
+            language (str): NLTK stopword list to use
+            cache_size (int): Number of memoized results to keep
+        """
+        self.language = language
+        self._stop_words = None
+        self._lock = threading.Lock()
+        self._cached_preprocess = functools.lru_cache(maxsize=cache_size)(self._preprocess)
+
+    @property
+    def stop_words(self):
+        """Frozen stopword set, loaded on first use."""
+        if self._stop_words is None:
+            with self._lock:
+                if self._stop_words is None:
+                    self._stop_words = self._load_stop_words()
+        return self._stop_words
+
+    def _load_stop_words(self):
+        """NLTK stopwords, or scikit-learn's English list when the corpus is unavailable."""
+        from nltk_resources import stopwords
+        try:
+            return stopwords(self.language)
+        except LookupError as e:
+            # Stopword corpus unavailable (e.g. offline); continue with a built-in list
+            print(f"Using built-in stopwords: {str(e)}")
+            if self.language != "english":
+                return frozenset()
+            from sklearn.feature_extraction.text import ENGLISH_STOP_WORDS
+            return frozenset(ENGLISH_STOP_WORDS)
+
+    def tokenize(self, text):
+        """
+        Lowercase text, strip punctuation and digits, and split into tokens.
+
+        Args:
+            text (str): Input text
+
+        Returns:
+            list: Tokens, stopwords included
+        """
+        return _STRIP_CHARS.sub("", text.lower()).split()
+
+    def _preprocess(self, text):
+        """Uncached preprocessing; see preprocess."""
+        stop_words = self.stop_words
+        return " ".join(token for token in self.tokenize(text) if token not in stop_words)
+
+    def preprocess(self, text):
+        """
+        Preprocess text for NLP tasks.
+
+        Args:
+            text (str): Input text
+
+        Returns:
+            str: Space-joined tokens with stopwords removed
+        """
+        if not text:
+            return ""
+        return self._cached_preprocess(str(text))
+
+    def terms(self, text):
+        """
+        Return the set of preprocessed terms in a text.
+
+        Args:
+            text (str): Input text
+
+        Returns:
+            set: Distinct non-stopword tokens
+        """
+        return set(self.preprocess(text).split())
+
+    def clear_cache(self):
+        """Drop memoized preprocessing results."""
+        self._cached_preprocess.cache_clear()
+
+
+# Shared pipeline instance for the whole app
+legal_text_pipeline = TextPipeline()
@@ -2,24 +2,9 @@ import streamlit as st
 import pandas as pd
 import numpy as np
 import re
-from nltk.tokenize import word_tokenize
-from nltk.corpus import stopwords
-import nltk
 import json
 import os
-
-# Download required NLTK data
-try:
-    nltk.data.find('tokenizers/punkt')
-    nltk.data.find('corpora/stopwords')
-except LookupError:
-    nltk.download('punkt', quiet=True)
-    nltk.download('stopwords', quiet=True)
-
-# Ensure NLTK data is downloaded
-print("Downloading NLTK resources if needed...")
-nltk.download('punkt', quiet=True)
-nltk.download('stopwords', quiet=True)
+from text_pipeline import legal_text_pipeline
 
 def load_svg(file_path):
     """Load an SVG file and return its contents as a string."""
@@ -38,25 +23,7 @@ def preprocess_text(text):
     if pd.isna(text) or text is None:
         return ""
     
-    # Convert to string if it's not already
-    text = str(text)
-    
-    # Remove special characters and numbers
-    text = re.sub(r'[^\w\s]', '', text)
-    text = re.sub(r'\d+', '', text)
-    
-    # Convert to lowercase
-    text = text.lower()
-    
-    # Tokenize
-    tokens = word_tokenize(text)
-    
-    # Remove stopwords
-    stop_words = set(stopwords.words('english'))
-    tokens = [word for word in tokens if word not in stop_words]
-    
-    # Rejoin tokens
-    return ' '.join(tokens)
+    return legal_text_pipeline.preprocess(str(text))
 
 def extract_section_numbers(text):
     """Extract IPC, IT Act, or MV Act section numbers from text."""